@@ -0,0 +1,214 @@
+"""File and cache helpers shared by the evaluation harnesses."""
+
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Optional, Sequence, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ahocorasick  # type: ignore[import]
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
+
+from src.storage.models import Constraints
+
+EVAL_DIR = os.path.dirname(os.path.abspath(__file__))
+# Both harnesses use the same layout, so a (model, topic, constraints) run
+# cached or reported by either is reused by the other
+REPORTS_DIR = os.path.join(EVAL_DIR, 'reports')
+PIPELINE_CACHE_DIR = os.path.join(EVAL_DIR, '.cache', 'pipeline')
+# Result files are appended through a 64 KiB buffer, so a drained batch of
+# records goes out in a single write
+NDJSON_BUFFER_SIZE = 1 << 16
+
+# Directories already created this process; skips a makedirs stat per write
+_CREATED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: str) -> None:
+    """Create a directory (and parents) the first time it is needed."""
+    if path not in _CREATED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+
+@functools.lru_cache(maxsize=256)
+def short_topic(topic: str, width: int = 50) -> str:
+    """Topic truncated for progress and summary lines; computed once per topic, not per line."""
+    return topic if len(topic) <= width else topic[:width] + "..."
+
+
+def new_run_stamp(results_dir: str, prefix: str) -> str:
+    """
+    Claim a run's file stamp; all output files for the run share it.
+    
+    A sequence suffix is added only if a run in the same second already
+    claimed the plain stamp, so concurrent runs never overwrite each other.
+    The claimed ``<prefix>_<stamp>.ndjson`` file is left in place, empty.
+    """
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    candidate = stamp
+    seq = 0
+    ensure_dir(results_dir)
+    while True:
+        try:
+            # Exclusive create claims the stamp atomically
+            with open(os.path.join(results_dir, f"{prefix}_{candidate}.ndjson"), "xb"):
+                return candidate
+        except FileExistsError:
+            seq += 1
+            candidate = f"{stamp}_{seq:02d}"
+
+
+def _json_default(obj: Any) -> Any:
+    # ModelConfig is a NamedTuple: stdlib json writes it as a list, orjson
+    # hands it to default, so keep the stdlib shape for both
+    if isinstance(obj, tuple):
+        return list(obj)
+    return str(obj)
+
+
+def json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0, default=_json_default)
+    return json.dumps(data, indent=2 if indent else None, default=_json_default).encode("utf-8")
+
+
+def ndjson_line(record: Dict[str, Any]) -> bytes:
+    """Serialize one result record as a newline-terminated JSON line."""
+    return json_bytes(record) + b"\n"
+
+
+def read_json_file(path: str) -> Optional[Any]:
+    """Read a JSON file, returning None if it is missing or unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read()) if orjson is not None else json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_bytes(path: str, content: bytes) -> None:
+    """Blocking atomic file write, meant to be run via asyncio.to_thread."""
+    # Per-thread temp name: concurrent topics may write the same content-addressed path
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_report(report_md: str) -> str:
+    """
+    Atomically write a report under eval/reports, named by content hash.
+
+    Returns:
+        The report's path relative to eval/, as stored in result records
+    """
+    data = report_md.encode("utf-8")
+    name = f"{hashlib.blake2b(data, digest_size=8).hexdigest()}.md"
+    ensure_dir(REPORTS_DIR)
+    write_bytes(os.path.join(REPORTS_DIR, name), data)
+    return f"reports/{name}"
+
+
+def pipeline_cache_path(topic: str, constraints: Constraints, model: str, version: str) -> str:
+    """Cache file for a pipeline run, keyed on topic, constraints, model and cache version."""
+    key_data = {
+        "topic": topic,
+        "constraints": constraints,
+        "model": model,
+        "version": version
+    }
+    key = hashlib.blake2b(
+        json.dumps(key_data, sort_keys=True, default=str).encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+    return os.path.join(PIPELINE_CACHE_DIR, f"{key}.json")
+
+
+@functools.lru_cache(maxsize=128)
+def _substring_automaton(keywords: FrozenSet[str]) -> Any:
+    """Aho-Corasick automaton over a keyword set (pyahocorasick); built once per set."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_substrings(text: str, keywords: FrozenSet[str]) -> FrozenSet[str]:
+    """
+    The keywords that occur anywhere in text (plain substring matches).
+    
+    With pyahocorasick installed all keywords are found in a single pass over
+    the text; otherwise each keyword is searched for once.
+    """
+    if ahocorasick is None or not any(keywords):
+        return frozenset(keyword for keyword in keywords if keyword in text)
+    found = {keyword for _, keyword in _substring_automaton(keywords).iter(text)}
+    # The empty string is not a valid automaton key but trivially occurs
+    if "" in keywords:
+        found.add("")
+    return frozenset(found)
+
+
+@functools.lru_cache(maxsize=128)
+def _element_keywords(expected_elements: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, ...], float], ...]:
+    """
+    Per expected element: its lower-cased keywords longer than 3 characters and
+    how many of them a report must contain to cover it (half of the element's
+    words, counting short ones). Tokenized once per topic, not once per report.
+    """
+    parsed = []
+    for element in expected_elements:
+        words = element.lower().split()
+        parsed.append((tuple(word for word in words if len(word) > 3), len(words) * 0.5))
+    return tuple(parsed)
+
+
+@functools.lru_cache(maxsize=128)
+def _coverage_keywords(expected_elements: Tuple[str, ...]) -> Tuple[FrozenSet[str], int]:
+    """All significant keywords of a topic's expected elements, and the length of the shortest."""
+    keywords = frozenset(
+        keyword for element_keywords, _ in _element_keywords(expected_elements)
+        for keyword in element_keywords
+    )
+    return keywords, min(map(len, keywords), default=0)
+
+
+def evaluate_content_coverage(report_content: str, expected_elements: Sequence[str]) -> float:
+    """
+    Fraction of expected elements a report covers.
+    
+    An element is covered when at least half of its words are significant
+    keywords found as substrings of the lower-cased report, so "policy" also
+    matches "policymakers". Both harnesses score with this function.
+    """
+    if not expected_elements:
+        return 1.0
+    
+    elements = _element_keywords(tuple(expected_elements))
+    keywords, shortest = _coverage_keywords(tuple(expected_elements))
+    content_lower = report_content.lower()
+    if len(content_lower) < shortest:
+        # Empty and stub reports cannot contain any keyword: skip the scan
+        # (and automaton setup). Elements without words still count as covered
+        found: FrozenSet[str] = frozenset()
+    else:
+        # Every keyword of every element is found in one scan of the report
+        found = find_substrings(content_lower, keywords)
+    covered_elements = sum(
+        1 for element_keywords, threshold in elements
+        if sum(1 for keyword in element_keywords if keyword in found) >= threshold
+    )
+    return covered_elements / len(expected_elements)
@@ -1,35 +1,260 @@
 """Evaluation harness for Nova Brief research agent."""
 
 import asyncio
+import copy
 import json
 import time
 import sys
 import os
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import functools
+import re
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Any, Optional, Tuple
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop  # type: ignore[import]
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+from eval_utils import (
+    NDJSON_BUFFER_SIZE, PIPELINE_CACHE_DIR, ensure_dir, evaluate_content_coverage, find_substrings,
+    json_bytes, ndjson_line, new_run_stamp, pipeline_cache_path, read_json_file, short_topic,
+    write_bytes, write_report
+)
+
+# Paths resolved once at import time
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_TOPICS_FILE = os.path.join(_HERE, 'topics.json')
+_RESULTS_DIR = _HERE
+_PIPELINE_CACHE_INDEX = os.path.join(PIPELINE_CACHE_DIR, '_index.json')
 
-from src.agent.orchestrator import run_research_pipeline
 from src.storage.models import create_default_constraints, Constraints
-from src.config import validate_environment
+from src.config import Config, validate_environment
+from src.storage.llm_cache import get_llm_cache
+from src.storage.cache import LFUCache
 from src.observability.logging import get_logger
+from src.observability.tracing import TraceEvent, clear_trace_events, get_trace_events
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = get_logger(__name__)
 
+# Per-stage time budgets (seconds) passed to the research pipeline; a stage
+# that overruns fails fast instead of consuming the topic's whole time slot.
+# "reading" covers the pipelined reading + analysis stage.
+_STAGE_BUDGETS_S = {
+    "planning": 30.0,
+    "searching": 60.0,
+    "reading": 240.0,
+    "verifying": 20.0,
+    "writing": 30.0
+}
+
+# Per-topic output lines, formatted once per result via format_map
+_TOPIC_COMPLETED_TMPL = (
+    "✅ Completed in {duration_s:.1f}s\n"
+    "📊 {word_count} words, {sources_count} sources"
+)
+_RESULT_DETAILS_TMPL = (
+    "     Duration: {duration_s:.1f}s, Words: {word_count}, "
+    "Sources: {sources_count}, Coverage: {coverage_score:.1%}"
+)
+_RESULT_DEFAULTS = {
+    "duration_s": 0.0,
+    "word_count": 0,
+    "sources_count": 0,
+    "coverage_score": 0.0
+}
+
+
+# Built-in topics written to the topics file when it does not exist yet
+_DEFAULT_TOPICS: Tuple[Dict[str, Any], ...] = (
+    {
+        "topic": "Impact of artificial intelligence on healthcare in 2024",
+        "expected_elements": (
+            "AI applications in healthcare",
+            "Current implementations",
+            "Benefits and challenges",
+            "Future prospects"
+        )
+    },
+    {
+        "topic": "Climate change mitigation strategies and their effectiveness",
+        "expected_elements": (
+            "Renewable energy adoption",
+            "Carbon capture technologies",
+            "Policy measures",
+            "International cooperation"
+        )
+    },
+    {
+        "topic": "Remote work trends and productivity impacts post-2020",
+        "expected_elements": (
+            "Adoption rates",
+            "Productivity studies",
+            "Employee satisfaction",
+            "Company policies"
+        )
+    },
+    {
+        "topic": "Cryptocurrency regulation developments in major economies",
+        "expected_elements": (
+            "Regulatory frameworks",
+            "Government positions",
+            "Market impacts",
+            "Compliance requirements"
+        )
+    },
+    {
+        "topic": "Electric vehicle market growth and infrastructure challenges",
+        "expected_elements": (
+            "Market statistics",
+            "Charging infrastructure",
+            "Government incentives",
+            "Consumer adoption"
+        )
+    }
+)
+
+
+def _summarize_trace_events(events: List[TraceEvent]) -> Dict[str, Any]:
+    """
+    Derive per-stage latencies and LLM usage from a topic's trace events.
+    
+    Stage times are summed across research rounds. Reading and analyzing are
+    pipelined, so their intervals overlap.
+    """
+    summary: Dict[str, Any] = {"llm_calls": 0, "llm_total_tokens": 0, "llm_cached_tokens": 0}
+    stage_starts: Dict[str, float] = {}
+    
+    for event in events:
+        if event.event_type == "stage_started":
+            stage_starts[event.metadata.get("stage", "")] = event.perf_counter
+        elif event.event_type == "stage_completed":
+            stage = event.metadata.get("stage", "")
+            started = stage_starts.pop(stage, None)
+            if started is not None:
+                key = f"{stage}_ms"
+                summary[key] = summary.get(key, 0.0) + (event.perf_counter - started) * 1000
+        elif event.event_type == "chat_completion_success":
+            summary["llm_calls"] += 1
+            summary["llm_total_tokens"] += event.metadata.get("total_tokens", 0)
+            summary["llm_cached_tokens"] += event.metadata.get("cached_tokens", 0)
+    
+    return summary
+
+
+# Common stopwords left out of sub-question keywords
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "up", "about", "into", "through", "during",
+    "before", "after", "above", "below", "between", "among", "this", "that",
+    "these", "those", "is", "are", "was", "were", "be", "been", "have",
+    "has", "had", "do", "does", "did", "will", "would", "could", "should"
+})
+
+
+@functools.lru_cache(maxsize=4)
+def _read_topics_file(path: str, mtime: float) -> tuple:
+    """Parse a topics file; memoized on its path and modification time."""
+    with open(path, 'rb') as f:
+        topics_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    return tuple(topics_data.get("topics", []))
+
+
+def _remove_files(paths: List[str]) -> None:
+    """Delete files, ignoring ones that are already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _load_pipeline_cache_uses() -> Dict[str, int]:
+    """Use counts of cached pipeline outcomes, reconciled with the files on disk."""
+    uses = read_json_file(_PIPELINE_CACHE_INDEX) or {}
+    try:
+        names = os.listdir(PIPELINE_CACHE_DIR)
+    except OSError:
+        return {}
+    index_name = os.path.basename(_PIPELINE_CACHE_INDEX)
+    return {
+        name: uses.get(name, 0)
+        for name in names
+        if name.endswith(".json") and name != index_name
+    }
+
+
+_RESULTS_STAMP_RE = re.compile(r'^results_(.+)\.ndjson$')
+
+
+def _read_ndjson_records(path: str) -> List[Dict[str, Any]]:
+    """
+    Read result records from an NDJSON results file.
+    
+    A trailing partial line left by a crashed run is truncated away so that
+    records appended on resume start on a fresh line.
+    """
+    with open(path, 'rb+') as f:
+        content = f.read()
+        if content and not content.endswith(b"\n"):
+            content = content[:content.rfind(b"\n") + 1]
+            f.truncate(len(content))
+    
+    records = []
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(orjson.loads(line) if orjson is not None else json.loads(line))
+        except ValueError:
+            logger.warning(f"Skipping unreadable result line in {path}")
+    return records
+
 
 class EvaluationHarness:
     """Evaluation harness for testing research agent performance."""
     
-    def __init__(self, topics_file: str = "eval/topics.json"):
+    def __init__(
+        self,
+        topics_file: str = _TOPICS_FILE,
+        use_cache: bool = True,
+        cache_version: str = "1",
+        cache_max_entries: int = 1000
+    ):
         self.topics_file = topics_file
+        # Pipeline outcomes are cached on disk so re-runs only re-score;
+        # bump cache_version to invalidate after pipeline/model changes.
+        # The cache keeps at most cache_max_entries outcomes, evicting the
+        # least frequently used ones (use counts persist in _index.json)
+        self.use_cache = use_cache
+        self.cache_version = cache_version
+        self.cache_max_entries = cache_max_entries
+        self._pipeline_cache_uses: Dict[str, int] = {}
         self.results: List[Dict[str, Any]] = []
+        # Shared across topics so overlapping queries/URLs are searched and fetched once
+        self._query_cache = LFUCache(max_entries=10_000)
+        self._url_cache = LFUCache(max_entries=10_000)
+        self._run_stamp: Optional[str] = None
+        self._http_client: Optional["httpx.AsyncClient"] = None
+        self.stage_budgets: Dict[str, float] = dict(_STAGE_BUDGETS_S)
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
     
     async def run_evaluation(
         self, 
         quick: bool = False,
-        max_topics: Optional[int] = None
+        max_topics: Optional[int] = None,
+        concurrency: int = 4,
+        cpu_workers: int = 0,
+        resume_from: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Run evaluation on test topics.
@@ -37,6 +262,12 @@ class EvaluationHarness:
         Args:
             quick: If True, run with reduced constraints for faster evaluation
             max_topics: Maximum number of topics to evaluate
+            concurrency: Maximum number of topics evaluated at the same time
+            cpu_workers: Worker processes for CPU-bound post-processing
+                (claim deduplication); 0 keeps it on the event loop
+            resume_from: NDJSON results file of an interrupted run; topics with
+                a successful record there are skipped and new results are
+                appended to the same file
         
         Returns:
             Evaluation results summary
@@ -45,7 +276,7 @@ class EvaluationHarness:
         print("=" * 50)
         
         # Load test topics
-        topics = self._load_topics()
+        topics = await self._load_topics()
         if not topics:
             print("❌ No evaluation topics found")
             return {"success": False, "error": "No topics loaded"}
@@ -54,70 +285,197 @@ class EvaluationHarness:
         if max_topics:
             topics = topics[:max_topics]
         
-        print(f"📋 Evaluating {len(topics)} topics")
+        print(f"📋 Evaluating {len(topics)} topics (concurrency: {concurrency})")
         if quick:
             print("⚡ Quick evaluation mode enabled")
         
         # Configure constraints for evaluation
         constraints = self._get_evaluation_constraints(quick)
         
-        # Run evaluation on each topic
-        start_time = time.time()
+        # Per-topic results are streamed to NDJSON as each topic completes, so
+        # long runs can be inspected mid-way and the summary file stays small
+        previous_results: List[Dict[str, Any]] = []
+        if resume_from:
+            try:
+                previous_results = self._load_resumed_results(resume_from)
+            except OSError as e:
+                print(f"❌ Could not resume from {resume_from}: {e}")
+                return {"success": False, "error": f"Could not resume: {e}"}
+            completed = {r["topic"] for r in previous_results}
+            topics = [t for t in topics if t["topic"] not in completed]
+            print(f"↩️  Resuming {resume_from}: {len(completed)} topics already done, {len(topics)} remaining")
+            results_file = resume_from
+            stamp_match = _RESULTS_STAMP_RE.match(os.path.basename(resume_from))
+            self._run_stamp = stamp_match.group(1) if stamp_match else new_run_stamp(_RESULTS_DIR, "results")
+        else:
+            self._run_stamp = new_run_stamp(_RESULTS_DIR, "results")
+            results_file = os.path.join(_RESULTS_DIR, f"results_{self._run_stamp}.ndjson")
         
-        for i, topic_data in enumerate(topics, 1):
-            print(f"\n{'='*20} Topic {i}/{len(topics)} {'='*20}")
-            
+        # Run evaluation on all topics concurrently; the semaphore bounds how
+        # many research pipelines hit the LLM/search providers at once
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        # A single writer task owns the results file; topic tasks only enqueue
+        # records, so disk writes never block the event loop
+        results_queue: asyncio.Queue = asyncio.Queue()
+        writer_task = asyncio.create_task(self._write_results(results_file, results_queue))
+        
+        async def _run_topic(index: int, topic_data: Dict[str, Any]) -> Dict[str, Any]:
             topic = topic_data["topic"]
-            expected_elements = topic_data.get("expected_elements", [])
-            
-            print(f"🎯 Topic: {topic}")
-            print(f"📝 Expected elements: {', '.join(expected_elements)}")
-            
-            # Run research pipeline
-            result = await self._evaluate_single_topic(
-                topic, 
-                constraints, 
-                expected_elements
-            )
+            async with semaphore:
+                try:
+                    result = await self._evaluate_single_topic(
+                        topic,
+                        constraints,
+                        topic_data.get("expected_elements", [])
+                    )
+                except Exception as e:
+                    logger.error(f"Evaluation task failed for topic '{topic}': {e}")
+                    result = self._create_failed_result(str(e), 0.0)
             
-            self.results.append({
+            record = {
                 "topic": topic,
-                "expected_elements": expected_elements,
-                **result
-            })
-            
-            # Print immediate results
-            if result["success"]:
-                print(f"✅ Completed in {result['duration_s']:.1f}s")
-                print(f"📊 {result['word_count']} words, {result['sources_count']} sources")
-            else:
-                print(f"❌ Failed: {result['error']}")
+                "expected_elements": topic_data.get("expected_elements", []),
+                **result,
+                "stage_metrics": _summarize_trace_events(get_trace_events())
+            }
+            self._log_metrics_line(record)
+            results_queue.put_nowait(record)
+            # Printed as soon as the topic finishes; the block has no awaits, so
+            # output from concurrently finishing topics cannot interleave
+            self._print_topic_result(index, len(topics), record)
+            return record
+        
+        if self.use_cache:
+            self._pipeline_cache_uses = await asyncio.to_thread(_load_pipeline_cache_uses)
+        
+        # Imported here rather than at module load so CPU pool workers, which
+        # re-import this module, and runs that only validate or resume skip them
+        import httpx
+        
+        # One pooled HTTP client for the whole run so connections, TLS sessions
+        # and DNS lookups are reused across topics
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        if cpu_workers > 0:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=cpu_workers)
+        try:
+            self.results = previous_results + list(await asyncio.gather(
+                *[_run_topic(i, topic_data) for i, topic_data in enumerate(topics, 1)]
+            ))
+        finally:
+            results_queue.put_nowait(None)
+            await writer_task
+            await self._http_client.aclose()
+            self._http_client = None
+            if self._cpu_pool is not None:
+                self._cpu_pool.shutdown(cancel_futures=True)
+                self._cpu_pool = None
+            if self.use_cache and os.path.isdir(PIPELINE_CACHE_DIR):
+                await asyncio.to_thread(
+                    write_bytes, _PIPELINE_CACHE_INDEX, json_bytes(self._pipeline_cache_uses)
+                )
         
         # Calculate overall metrics
-        total_duration = time.time() - start_time
+        total_duration = time.perf_counter() - start_time
         evaluation_summary = self._calculate_evaluation_metrics(total_duration)
+        evaluation_summary["results_file"] = results_file
         
         # Save results
-        self._save_results(evaluation_summary)
+        await self._save_results(evaluation_summary)
         
         # Print summary
         self._print_evaluation_summary(evaluation_summary)
         
         return evaluation_summary
     
-    def _load_topics(self) -> List[Dict[str, Any]]:
+    def _print_topic_result(self, index: int, total: int, result: Dict[str, Any]) -> None:
+        """Print one topic's outcome as a single write."""
+        lines = [
+            f"\n{'='*20} Topic {index}/{total} {'='*20}",
+            f"🎯 Topic: {result['topic']}",
+            f"📝 Expected elements: {', '.join(result['expected_elements'])}"
+        ]
+        
+        if result["success"]:
+            lines.append(_TOPIC_COMPLETED_TMPL.format_map(ChainMap(result, _RESULT_DEFAULTS)))
+        else:
+            lines.append(f"❌ Failed: {result['error']}")
+        print("\n".join(lines))
+    
+    def _log_metrics_line(self, record: Dict[str, Any]) -> None:
+        """Log one machine-readable <json> metrics line per completed topic."""
+        metrics = {
+            "topic": record["topic"],
+            "success": record["success"],
+            "duration_s": record["duration_s"],
+            "word_count": record["word_count"],
+            "sources_count": record["sources_count"],
+            "coverage_score": record["coverage_score"],
+            **record["stage_metrics"],
+            "ts": time.time()
+        }
+        logger.info("<json>" + json_bytes(metrics).decode("utf-8") + "</json>")
+    
+    async def _write_results(self, results_file: str, results_queue: asyncio.Queue) -> None:
+        """Append queued result records to the NDJSON file until a None sentinel arrives."""
+        
+        def _write_batch(results_out: BinaryIO, records: List[Dict[str, Any]]) -> None:
+            # Serialized here, in the worker thread, so encoding large records
+            # never holds up the event loop; records are not mutated once queued
+            results_out.writelines([ndjson_line(record) for record in records])
+            results_out.flush()
+        
+        # Append mode: a fresh run's file was just created empty, a resumed
+        # run keeps the records it already has. The 64 KiB buffer lets a
+        # drained batch of records go out in one write before the flush
+        with open(results_file, "ab", buffering=NDJSON_BUFFER_SIZE) as results_out:
+            done = False
+            while not done:
+                record = await results_queue.get()
+                if record is None:
+                    break
+                
+                # Drain whatever else is already queued into the same write
+                records = [record]
+                while not results_queue.empty():
+                    record = results_queue.get_nowait()
+                    if record is None:
+                        done = True
+                        break
+                    records.append(record)
+                
+                await asyncio.to_thread(_write_batch, results_out, records)
+    
+    def _load_resumed_results(self, results_file: str) -> List[Dict[str, Any]]:
+        """
+        Load the successful records of an interrupted run, one per topic.
+        
+        Failed topics are left out so they are evaluated again.
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        for record in _read_ndjson_records(results_file):
+            if "topic" in record:
+                latest[record["topic"]] = record
+        return [r for r in latest.values() if r.get("success")]
+    
+    async def _load_topics(self) -> List[Dict[str, Any]]:
         """Load evaluation topics from JSON file."""
         try:
             if not os.path.exists(self.topics_file):
                 # Create default topics if file doesn't exist
                 default_topics = self._create_default_topics()
-                self._save_topics(default_topics)
+                await self._save_topics(default_topics)
                 return default_topics
             
-            with open(self.topics_file, 'r') as f:
-                topics_data = json.load(f)
-            
-            return topics_data.get("topics", [])
+            # Parsed once per (path, mtime); editing the file invalidates the
+            # entry. A cache miss reads the file in a worker thread. Callers get
+            # a deep copy so they cannot mutate the memoized topics
+            mtime = os.path.getmtime(self.topics_file)
+            topics = await asyncio.to_thread(_read_topics_file, self.topics_file, mtime)
+            return copy.deepcopy(list(topics))
         
         except Exception as e:
             print(f"❌ Error loading topics: {e}")
@@ -125,58 +483,16 @@ class EvaluationHarness:
     
     def _create_default_topics(self) -> List[Dict[str, Any]]:
         """Create default evaluation topics."""
+        # Fresh lists so callers can mutate the result without touching the constant
         return [
-            {
-                "topic": "Impact of artificial intelligence on healthcare in 2024",
-                "expected_elements": [
-                    "AI applications in healthcare",
-                    "Current implementations",
-                    "Benefits and challenges",
-                    "Future prospects"
-                ]
-            },
-            {
-                "topic": "Climate change mitigation strategies and their effectiveness",
-                "expected_elements": [
-                    "Renewable energy adoption",
-                    "Carbon capture technologies",
-                    "Policy measures",
-                    "International cooperation"
-                ]
-            },
-            {
-                "topic": "Remote work trends and productivity impacts post-2020",
-                "expected_elements": [
-                    "Adoption rates",
-                    "Productivity studies",
-                    "Employee satisfaction",
-                    "Company policies"
-                ]
-            },
-            {
-                "topic": "Cryptocurrency regulation developments in major economies",
-                "expected_elements": [
-                    "Regulatory frameworks",
-                    "Government positions", 
-                    "Market impacts",
-                    "Compliance requirements"
-                ]
-            },
-            {
-                "topic": "Electric vehicle market growth and infrastructure challenges",
-                "expected_elements": [
-                    "Market statistics",
-                    "Charging infrastructure",
-                    "Government incentives",
-                    "Consumer adoption"
-                ]
-            }
+            {"topic": t["topic"], "expected_elements": list(t["expected_elements"])}
+            for t in _DEFAULT_TOPICS
         ]
     
-    def _save_topics(self, topics: List[Dict[str, Any]]):
+    async def _save_topics(self, topics: List[Dict[str, Any]]) -> None:
         """Save topics to JSON file."""
         try:
-            os.makedirs(os.path.dirname(self.topics_file), exist_ok=True)
+            ensure_dir(os.path.dirname(self.topics_file))
             
             topics_data = {
                 "description": "Evaluation topics for Nova Brief research agent",
@@ -184,15 +500,16 @@ class EvaluationHarness:
                 "topics": topics
             }
             
-            with open(self.topics_file, 'w') as f:
-                json.dump(topics_data, f, indent=2)
+            await asyncio.to_thread(
+                write_bytes, self.topics_file, json_bytes(topics_data, indent=True)
+            )
             
             print(f"💾 Created default topics file: {self.topics_file}")
         
         except Exception as e:
             print(f"❌ Error saving topics: {e}")
     
-    def _get_evaluation_constraints(self, quick: bool = False):
+    def _get_evaluation_constraints(self, quick: bool = False) -> Constraints:
         """Get constraints configured for evaluation."""
         constraints = create_default_constraints()
         
@@ -217,72 +534,124 @@ class EvaluationHarness:
     ) -> Dict[str, Any]:
         """Evaluate research pipeline on a single topic."""
         
-        topic_start_time = time.time()
+        # Each topic runs in its own task, so this only resets this topic's trace buffer
+        clear_trace_events()
+        topic_start_time = time.perf_counter()
         
         try:
-            # Run research pipeline
-            result = await run_research_pipeline(topic, constraints)
+            cache_path = self._pipeline_cache_path(topic, constraints) if self.use_cache else None
+            outcome = await asyncio.to_thread(read_json_file, cache_path) if cache_path else None
+            cached = outcome is not None
+            if cached and cache_path is not None:
+                cache_name = os.path.basename(cache_path)
+                self._pipeline_cache_uses[cache_name] = self._pipeline_cache_uses.get(cache_name, 0) + 1
             
-            duration = time.time() - topic_start_time
-            
-            if result["success"]:
-                # Extract metrics from result
-                state = result["state"]
-                report = result["report"]
-                metrics = result["metrics"]
+            if outcome is None:
+                from src.agent.orchestrator import run_research_pipeline
                 
-                # Evaluate content coverage
-                coverage_score = self._evaluate_content_coverage(
-                    report["report_md"],
-                    expected_elements
+                # Run research pipeline
+                result = await run_research_pipeline(
+                    topic,
+                    constraints,
+                    search_cache=self._query_cache,
+                    fetch_cache=self._url_cache,
+                    http_client=self._http_client,
+                    stage_timeouts=self.stage_budgets,
+                    cpu_executor=self._cpu_pool
                 )
                 
-                # Stage 1.5: Compute sub-question coverage
-                sub_question_coverage = self.compute_sub_question_coverage(
-                    report["report_md"],
-                    state.get("sub_questions", [])
-                )
+                if not result["success"]:
+                    return self._create_failed_result(
+                        result["error"], time.perf_counter() - topic_start_time
+                    )
                 
-                return {
-                    "success": True,
-                    "duration_s": duration,
+                # Keep only what scoring needs from the pipeline result
+                state = result["state"]
+                report = result["report"]
+                outcome = {
+                    "duration_s": time.perf_counter() - topic_start_time,
+                    "report_md": report["report_md"],
                     "word_count": report["word_count"],
-                    "sources_count": metrics["sources_count"],
+                    "sources_count": result["metrics"]["sources_count"],
                     "claims_count": len(state["claims"]),
                     "citations_count": len(state["citations"]),
-                    "coverage_score": coverage_score,
-                    "sub_question_coverage": sub_question_coverage,
-                    "report_md": report["report_md"],
-                    "error": None
-                }
-            else:
-                return {
-                    "success": False,
-                    "duration_s": duration,
-                    "error": result["error"],
-                    "word_count": 0,
-                    "sources_count": 0,
-                    "claims_count": 0,
-                    "citations_count": 0,
-                    "coverage_score": 0.0,
-                    "sub_question_coverage": {"covered": 0, "total": 0, "score": 0.0, "details": []}
+                    "sub_questions": state.get("sub_questions", [])
                 }
+                
+                if cache_path:
+                    ensure_dir(PIPELINE_CACHE_DIR)
+                    await asyncio.to_thread(write_bytes, cache_path, json_bytes(outcome))
+                    await self._evict_pipeline_cache(os.path.basename(cache_path))
+            
+            # Evaluate content coverage
+            coverage_score = self._evaluate_content_coverage(
+                outcome["report_md"],
+                expected_elements
+            )
+            
+            # Stage 1.5: Compute sub-question coverage
+            sub_question_coverage = self.compute_sub_question_coverage(
+                outcome["report_md"],
+                outcome["sub_questions"]
+            )
+            
+            # Reports are written out by content hash and referenced by path, so
+            # per-topic records (kept for the whole run) stay small
+            report_path = await asyncio.to_thread(write_report, outcome["report_md"])
+            
+            return {
+                "success": True,
+                # Cached outcomes report the original pipeline duration so
+                # timing metrics stay comparable across re-runs
+                "duration_s": outcome["duration_s"],
+                "cached": cached,
+                "word_count": outcome["word_count"],
+                "sources_count": outcome["sources_count"],
+                "claims_count": outcome["claims_count"],
+                "citations_count": outcome["citations_count"],
+                "coverage_score": coverage_score,
+                "sub_question_coverage": sub_question_coverage,
+                "report_path": report_path,
+                "error": None
+            }
         
         except Exception as e:
-            duration = time.time() - topic_start_time
+            duration = time.perf_counter() - topic_start_time
             logger.error(f"Evaluation failed for topic '{topic}': {e}")
             
-            return {
-                "success": False,
-                "duration_s": duration,
-                "error": str(e),
-                "word_count": 0,
-                "sources_count": 0,
-                "claims_count": 0,
-                "citations_count": 0,
-                "coverage_score": 0.0,
-                "sub_question_coverage": {"covered": 0, "total": 0, "score": 0.0, "details": []}
-            }
+            return self._create_failed_result(str(e), duration)
+    
+    def _pipeline_cache_path(self, topic: str, constraints: Constraints) -> str:
+        """Cache file for a pipeline run with the configured model."""
+        return pipeline_cache_path(topic, constraints, Config.SELECTED_MODEL, self.cache_version)
+    
+    async def _evict_pipeline_cache(self, new_entry: str) -> None:
+        """Record a new cache entry and evict least frequently used ones over the cap."""
+        uses = self._pipeline_cache_uses
+        uses.setdefault(new_entry, 0)
+        victims = []
+        while len(uses) > max(1, self.cache_max_entries):
+            # Never evict the entry that was just written
+            victim = min((name for name in uses if name != new_entry), key=uses.__getitem__)
+            del uses[victim]
+            victims.append(os.path.join(PIPELINE_CACHE_DIR, victim))
+        if victims:
+            await asyncio.to_thread(_remove_files, victims)
+    
+    def _create_failed_result(self, error: str, duration: float) -> Dict[str, Any]:
+        """Create a result entry for a topic whose evaluation failed."""
+        return {
+            "success": False,
+            "duration_s": duration,
+            "cached": False,
+            "error": error,
+            "word_count": 0,
+            "sources_count": 0,
+            "claims_count": 0,
+            "citations_count": 0,
+            "coverage_score": 0.0,
+            "sub_question_coverage": {"covered": 0, "total": 0, "score": 0.0, "details": []}
+        }
     
     def _evaluate_content_coverage(
         self,
@@ -290,23 +659,7 @@ class EvaluationHarness:
         expected_elements: List[str]
     ) -> float:
         """Evaluate how well the report covers expected elements."""
-        if not expected_elements:
-            return 1.0
-        
-        content_lower = report_content.lower()
-        covered_elements = 0
-        
-        for element in expected_elements:
-            # Simple keyword matching - could be enhanced with semantic similarity
-            element_keywords = element.lower().split()
-            
-            # Check if any significant words from the element appear in content
-            matches = sum(1 for keyword in element_keywords if len(keyword) > 3 and keyword in content_lower)
-            
-            if matches >= len(element_keywords) * 0.5:  # At least 50% of keywords found
-                covered_elements += 1
-        
-        return covered_elements / len(expected_elements)
+        return evaluate_content_coverage(report_content, expected_elements)
     
     def compute_sub_question_coverage(
         self,
@@ -341,26 +694,20 @@ class EvaluationHarness:
         covered_count = 0
         details = []
         
-        # Define common stopwords to filter out
-        stopwords = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "up", "about", "into", "through", "during",
-            "before", "after", "above", "below", "between", "among", "this", "that",
-            "these", "those", "is", "are", "was", "were", "be", "been", "have",
-            "has", "had", "do", "does", "did", "will", "would", "could", "should"
-        }
+        # Extract meaningful keywords from each question
+        question_keywords = [
+            [word.strip("?.,!:;()[]{}\"'") for word in question.lower().split()
+             if len(word) > 3 and word.lower() not in _STOPWORDS]
+            for question in sub_questions
+        ]
+        # Find every question's keywords in one scan of the report
+        found = find_substrings(
+            report_lower, frozenset(kw for keywords in question_keywords for kw in keywords)
+        )
         
-        for question in sub_questions:
-            # Extract meaningful keywords from the question
-            question_words = question.lower().split()
-            keywords = [word.strip("?.,!:;()[]{}\"'") for word in question_words
-                        if len(word) > 3 and word.lower() not in stopwords]
-            
+        for question, keywords in zip(sub_questions, question_keywords):
             # Count keyword matches in the report
-            matches = []
-            for keyword in keywords:
-                if keyword in report_lower:
-                    matches.append(keyword)
+            matches = [keyword for keyword in keywords if keyword in found]
             
             # Consider question addressed if at least 40% of keywords are found
             addressed = len(matches) >= len(keywords) * 0.4 if keywords else False
@@ -389,93 +736,129 @@ class EvaluationHarness:
         if not self.results:
             return {"success": False, "error": "No results to evaluate"}
         
-        successful_runs = [r for r in self.results if r["success"]]
-        failed_runs = [r for r in self.results if not r["success"]]
-        
-        if successful_runs:
-            avg_duration = sum(r["duration_s"] for r in successful_runs) / len(successful_runs)
-            avg_word_count = sum(r["word_count"] for r in successful_runs) / len(successful_runs)
-            avg_sources = sum(r["sources_count"] for r in successful_runs) / len(successful_runs)
-            avg_coverage = sum(r["coverage_score"] for r in successful_runs) / len(successful_runs)
+        # Single pass over the results: count outcomes and accumulate the
+        # successful runs' totals as local floats
+        successful_count = 0
+        duration_sum = word_count_sum = sources_sum = coverage_sum = sub_question_sum = 0.0
+        for r in self.results:
+            if not r["success"]:
+                continue
+            successful_count += 1
+            duration_sum += r["duration_s"]
+            word_count_sum += r["word_count"]
+            sources_sum += r["sources_count"]
+            coverage_sum += r["coverage_score"]
             # Stage 1.5: Average sub-question coverage
-            avg_sub_question_coverage = sum(r["sub_question_coverage"]["score"] for r in successful_runs) / len(successful_runs)
+            sub_question_sum += r["sub_question_coverage"]["score"]
+        failed_count = len(self.results) - successful_count
+        
+        if successful_count:
+            avg_duration = duration_sum / successful_count
+            avg_word_count = word_count_sum / successful_count
+            avg_sources = sources_sum / successful_count
+            avg_coverage = coverage_sum / successful_count
+            avg_sub_question_coverage = sub_question_sum / successful_count
         else:
             avg_duration = avg_word_count = avg_sources = avg_coverage = avg_sub_question_coverage = 0
         
+        llm_cache = get_llm_cache()
+        
         return {
             "success": True,
+            "llm_cache": llm_cache.stats() if llm_cache else None,
+            "search_cache": self._query_cache.stats(),
+            "fetch_cache": self._url_cache.stats(),
             "total_topics": len(self.results),
-            "successful_topics": len(successful_runs),
-            "failed_topics": len(failed_runs),
-            "success_rate": len(successful_runs) / len(self.results) * 100,
+            "successful_topics": successful_count,
+            "failed_topics": failed_count,
+            "success_rate": successful_count / len(self.results) * 100,
             "total_duration_s": total_duration,
             "avg_duration_s": avg_duration,
             "avg_word_count": avg_word_count,
             "avg_sources_count": avg_sources,
             "avg_coverage_score": avg_coverage,
-            "avg_sub_question_coverage": avg_sub_question_coverage,
-            "results": self.results
+            "avg_sub_question_coverage": avg_sub_question_coverage
         }
     
-    def _save_results(self, evaluation_summary: Dict[str, Any]):
-        """Save evaluation results to file."""
+    async def _save_results(self, evaluation_summary: Dict[str, Any]) -> None:
+        """Save the evaluation summary; per-topic results are already in the NDJSON file."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            results_file = f"eval/results_{timestamp}.json"
+            summary_file = os.path.join(_RESULTS_DIR, f"results_{self._run_stamp}.json")
             
-            os.makedirs(os.path.dirname(results_file), exist_ok=True)
+            ensure_dir(os.path.dirname(summary_file))
             
-            with open(results_file, 'w') as f:
-                json.dump(evaluation_summary, f, indent=2, default=str)
+            # Write off the event loop so concurrent tasks are never stalled on disk I/O
+            await asyncio.to_thread(
+                write_bytes, summary_file, json_bytes(evaluation_summary, indent=True)
+            )
             
-            print(f"💾 Results saved to: {results_file}")
+            print(f"💾 Summary saved to: {summary_file}")
+            print(f"💾 Per-topic results: {evaluation_summary['results_file']}")
         
         except Exception as e:
             print(f"⚠️  Could not save results: {e}")
     
-    def _print_evaluation_summary(self, summary: Dict[str, Any]):
-        """Print evaluation summary."""
-        print(f"\n{'='*50}")
-        print("📊 EVALUATION SUMMARY")
-        print("=" * 50)
+    def _print_evaluation_summary(self, summary: Dict[str, Any]) -> None:
+        """Print evaluation summary, collected into lines and written with one print."""
+        lines = [f"\n{'='*50}", "📊 EVALUATION SUMMARY", "=" * 50]
         
         if not summary["success"]:
-            print(f"❌ Evaluation failed: {summary.get('error')}")
+            lines.append(f"❌ Evaluation failed: {summary.get('error')}")
+            print("\n".join(lines))
             return
         
-        print(f"Topics Evaluated: {summary['total_topics']}")
-        print(f"Success Rate: {summary['success_rate']:.1f}% ({summary['successful_topics']}/{summary['total_topics']})")
-        print(f"Total Duration: {summary['total_duration_s']:.1f}s")
+        lines.append(f"Topics Evaluated: {summary['total_topics']}")
+        lines.append(f"Success Rate: {summary['success_rate']:.1f}% ({summary['successful_topics']}/{summary['total_topics']})")
+        lines.append(f"Total Duration: {summary['total_duration_s']:.1f}s")
         
         if summary['successful_topics'] > 0:
-            print(f"Average Duration: {summary['avg_duration_s']:.1f}s per topic")
-            print(f"Average Word Count: {summary['avg_word_count']:.0f} words")
-            print(f"Average Sources: {summary['avg_sources_count']:.1f} sources")
-            print(f"Average Coverage: {summary['avg_coverage_score']:.1%}")
-        
-        # Print individual results
-        print(f"\n📋 Individual Results:")
-        for i, result in enumerate(summary['results'], 1):
-            status = "✅" if result["success"] else "❌"
-            topic = result["topic"][:60] + "..." if len(result["topic"]) > 60 else result["topic"]
+            lines.append(f"Average Duration: {summary['avg_duration_s']:.1f}s per topic")
+            lines.append(f"Average Word Count: {summary['avg_word_count']:.0f} words")
+            lines.append(f"Average Sources: {summary['avg_sources_count']:.1f} sources")
+            lines.append(f"Average Coverage: {summary['avg_coverage_score']:.1%}")
+        
+        if summary.get("llm_cache"):
+            cache_stats = summary["llm_cache"]
+            lines.append(f"LLM Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                         f"({cache_stats['hit_rate']:.1%} hit rate)")
+        
+        # Individual results
+        lines.append(f"\n📋 Individual Results:")
+        for i, result in enumerate(self.results, 1):
+            topic = short_topic(result["topic"], 60)
             
             if result["success"]:
-                print(f"{status} {i:2d}. {topic}")
-                print(f"     Duration: {result['duration_s']:.1f}s, Words: {result['word_count']}, "
-                      f"Sources: {result['sources_count']}, Coverage: {result['coverage_score']:.1%}")
+                details = _RESULT_DETAILS_TMPL.format_map(ChainMap(result, _RESULT_DEFAULTS))
+                lines.append(f"✅ {i:2d}. {topic}\n{details}")
             else:
-                print(f"{status} {i:2d}. {topic}")
-                print(f"     Error: {result['error']}")
-
+                lines.append(f"❌ {i:2d}. {topic}\n     Error: {result['error']}")
+        
+        print("\n".join(lines))
 
-async def main():
+async def main() -> bool:
     """Main evaluation function."""
     import argparse
     
-    parser = argparse.ArgumentParser(description="Nova Brief Evaluation Harness")
+    parser = argparse.ArgumentParser(
+        description="Nova Brief Evaluation Harness",
+        epilog="Runs on uvloop when it is installed. Leave PYTHONASYNCIODEBUG unset "
+               "(or 0) for timing runs; asyncio debug mode slows the event loop down."
+    )
     parser.add_argument("--quick", action="store_true", help="Run quick evaluation")
     parser.add_argument("--max-topics", type=int, help="Maximum number of topics to evaluate")
-    parser.add_argument("--topics-file", default="eval/topics.json", help="Topics file path")
+    parser.add_argument("--topics-file", default=_TOPICS_FILE, help="Topics file path")
+    parser.add_argument("--concurrency", type=int, default=4,
+                       help="Maximum number of topics evaluated concurrently")
+    parser.add_argument("--cpu-workers", type=int, default=0,
+                       help="Worker processes for CPU-bound post-processing (0 = in-process)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always run the research pipeline instead of reusing cached outcomes")
+    parser.add_argument("--cache-version", default="1",
+                       help="Salt for pipeline cache keys; change it to invalidate cached outcomes")
+    parser.add_argument("--cache-max-entries", type=int, default=1000,
+                       help="Maximum cached pipeline outcomes; least frequently used are evicted")
+    parser.add_argument("--resume", metavar="PATH",
+                       help="Resume an interrupted run from its results_<stamp>.ndjson file")
     
     args = parser.parse_args()
     
@@ -485,12 +868,20 @@ async def main():
         return False
     
     # Run evaluation
-    harness = EvaluationHarness(args.topics_file)
+    harness = EvaluationHarness(
+        args.topics_file,
+        use_cache=not args.no_cache,
+        cache_version=args.cache_version,
+        cache_max_entries=args.cache_max_entries
+    )
     
     try:
         summary = await harness.run_evaluation(
             quick=args.quick,
-            max_topics=args.max_topics
+            max_topics=args.max_topics,
+            concurrency=args.concurrency,
+            cpu_workers=args.cpu_workers,
+            resume_from=args.resume
         )
         
         # Determine exit code based on success rate
@@ -516,5 +907,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    # uvloop is a faster drop-in event loop for the I/O-bound pipeline runs
+    success = uvloop.run(main()) if uvloop is not None else asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -5,20 +5,85 @@ import json
 import time
 import sys
 import os
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
-import statistics
+import math
+from operator import itemgetter
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Any, Optional, Tuple, Union
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-from src.agent.orchestrator import run_research_pipeline
 from src.storage.models import create_default_constraints, Constraints
 from src.config import Config, validate_environment
 from src.observability.logging import get_logger
 
+from eval_utils import (
+    NDJSON_BUFFER_SIZE, PIPELINE_CACHE_DIR, ensure_dir, evaluate_content_coverage, json_bytes,
+    ndjson_line, new_run_stamp, pipeline_cache_path, read_json_file, short_topic, write_bytes,
+    write_report
+)
+
+# The research stack (orchestrator, provider SDKs, httpx) is imported where it
+# is first used so --list-models and --help start without loading it
+if TYPE_CHECKING:
+    import httpx
+
 logger = get_logger(__name__)
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# A model whose evaluations fail this many times in a row with the same
+# configuration or authentication error has its remaining evaluations cancelled
+_MAX_CONSECUTIVE_FAILURES = 3
+
+# Lower-cased error fragments that mark a failure as configuration or auth
+# (missing key, 401/403, unknown model), which retrying other topics cannot
+# fix. Anything else, such as timeouts, 429s and 5xx, is treated as transient.
+_FATAL_ERROR_MARKERS = (
+    "api key", "api_key", "401", "403", "unauthorized", "forbidden",
+    "authentication", "permission denied", "invalid model", "unknown model",
+    "model not found", "no such model", "not a valid model"
+)
+
+
+def _is_fatal_error(error: str) -> bool:
+    """Whether an evaluation error is a configuration or auth error rather than a transient one."""
+    error = error.lower()
+    return any(marker in error for marker in _FATAL_ERROR_MARKERS)
+
+
+# Per-model fields aggregated in _calculate_comparative_metrics
+_METRIC_FIELDS = ("duration_s", "word_count", "sources_count", "coverage_score")
+
+
+def _running_stats(runs: List[Dict[str, Any]]) -> Tuple[int, Dict[str, Tuple[float, float]]]:
+    """
+    Count the successful runs and compute the mean and sample standard
+    deviation of each of their metric fields, all in a single pass.
+    
+    Uses Welford's online algorithm, which is numerically stable and avoids a
+    separate traversal per field for the means and again for the variances.
+    """
+    count = 0
+    means = dict.fromkeys(_METRIC_FIELDS, 0.0)
+    m2 = dict.fromkeys(_METRIC_FIELDS, 0.0)
+    for r in runs:
+        if not r["success"]:
+            continue
+        count += 1
+        for field in _METRIC_FIELDS:
+            value = r[field]
+            delta = value - means[field]
+            means[field] += delta / count
+            m2[field] += delta * (value - means[field])
+    
+    return count, {
+        field: (means[field], math.sqrt(m2[field] / (count - 1)) if count > 1 else 0)
+        for field in _METRIC_FIELDS
+    }
+
 
 class MultiModelEvaluationHarness:
     """Multi-model evaluation harness for comparing research agent performance across different models."""
@@ -43,10 +108,37 @@ class MultiModelEvaluationHarness:
         ]
     }
     
-    def __init__(self, topics_file: str = "eval/topics.json"):
+    def __init__(
+        self,
+        topics_file: str = "eval/topics.json",
+        use_cache: bool = True,
+        cache_version: str = "1"
+    ):
         self.topics_file = topics_file
+        # Pipeline outcomes are cached on disk per (model, topic, constraints)
+        # so re-running a comparison only re-runs changed models; bump
+        # cache_version to invalidate after pipeline changes
+        self.use_cache = use_cache
+        self.cache_version = cache_version
         self.results: List[Dict[str, Any]] = []
         self.config = Config()
+        # Looked up once; the model registry is fixed for the life of the process
+        self._models_dict = self.config.get_available_models_dict()
+        # One semaphore per LLM provider: different providers run fully in
+        # parallel while each one stays under its rate limit
+        self._provider_sems: Dict[str, asyncio.Semaphore] = {}
+        # Per-result progress lines (str) and completed (model, topic) records
+        # (dict), written to stdout and the run's NDJSON file by _write_output
+        # in a worker thread, so finishing tasks never block on I/O
+        self._output_queue: Optional["asyncio.Queue[Union[str, Dict[str, Any], None]]"] = None
+        self._run_stamp: Optional[str] = None
+        # Early termination bookkeeping, reset per run: evaluation tasks by
+        # model, each model's current (error, streak length), and the models
+        # that were stopped early with the error that stopped them
+        self._model_tasks: Dict[str, List[asyncio.Task]] = {}
+        self._failure_streaks: Dict[str, Tuple[str, int]] = {}
+        self.aborted_models: Dict[str, str] = {}
+        self._http_client: Optional["httpx.AsyncClient"] = None
     
     async def run_multi_model_evaluation(
         self,
@@ -101,14 +193,17 @@ class MultiModelEvaluationHarness:
         constraints = self._get_evaluation_constraints(quick)
         
         # Run evaluation across all models and topics in parallel
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         print(f"\n🚀 Starting parallel evaluation across {len(models)} models and {len(topics)} topics")
         
         # Create all model-topic combinations for parallel execution
         evaluation_tasks = []
+        self._model_tasks = {}
+        self._failure_streaks = {}
+        self.aborted_models = {}
         for model in models:
-            model_config = self.config.get_available_models_dict().get(model)
+            model_config = self._models_dict.get(model)
             print(f"\n🤖 {model}")
             if model_config:
                 print(f"     Provider: {model_config.provider}")
@@ -120,17 +215,75 @@ class MultiModelEvaluationHarness:
                 expected_elements = topic_data.get("expected_elements", [])
                 
                 # Create async task for this model-topic combination
-                task = self._evaluate_single_model_topic_with_metadata(
+                task = asyncio.create_task(self._evaluate_single_model_topic_with_metadata(
                     model, topic, constraints, expected_elements
-                )
+                ))
                 evaluation_tasks.append(task)
+                self._model_tasks.setdefault(model, []).append(task)
         
         print(f"\n⚡ Running {len(evaluation_tasks)} evaluations in parallel...")
         
-        # Execute all evaluations in parallel with progress tracking
-        results = await asyncio.gather(*evaluation_tasks, return_exceptions=True)
+        # Execute all evaluations in parallel; each queues its own line as it
+        # finishes, so progress streams instead of appearing all at the end
+        import httpx
+        
+        # Each result is streamed to NDJSON as it completes, so a crashed or
+        # interrupted comparison keeps every pair that had already finished
+        self._run_stamp = new_run_stamp(_HERE, "multi_model_results")
+        results_file = os.path.join(_HERE, f"multi_model_results_{self._run_stamp}.ndjson")
+        # A single writer task owns stdout and the results file; evaluation
+        # tasks only enqueue
+        output_queue: "asyncio.Queue[Union[str, Dict[str, Any], None]]" = asyncio.Queue()
+        self._output_queue = output_queue
+        writer_task = asyncio.create_task(self._write_output(results_file, output_queue))
+        # One pooled HTTP client shared by every model and topic so fetches
+        # and URL checks reuse connections instead of re-handshaking per run;
+        # the tasks above first run at the gather, after it exists
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        try:
+            try:
+                results = await asyncio.gather(*evaluation_tasks, return_exceptions=True)
+            finally:
+                await self._http_client.aclose()
+                self._http_client = None
+            model_results = self._collect_model_results(models, topics, results)
+        finally:
+            output_queue.put_nowait(None)
+            await writer_task
+            self._output_queue = None
+        
+        for model, error in self.aborted_models.items():
+            print(f"⛔ {model}: stopped after {_MAX_CONSECUTIVE_FAILURES} consecutive failures: {error}")
+            print(f"   Retry just this model with: --models {model}")
+        
+        # Calculate comparative metrics
+        total_duration = time.perf_counter() - start_time
+        evaluation_summary = self._calculate_comparative_metrics(model_results, total_duration)
+        evaluation_summary["results_file"] = results_file
+        
+        # Save results
+        self._save_multi_model_results(evaluation_summary)
+        
+        # Print comparative summary
+        self._print_comparative_summary(evaluation_summary)
         
-        # Organize results by model
+        return evaluation_summary
+    
+    def _collect_model_results(
+        self,
+        models: List[str],
+        topics: List[Dict[str, Any]],
+        results: List[Any]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Organize gathered results by model, in topic order.
+        
+        Pairs that produced no result of their own (cancelled after their model
+        was stopped, or raised) get a failure entry, which is also queued for
+        the NDJSON results file so it accounts for every pair.
+        """
         model_results = {}
         task_idx = 0
         
@@ -140,68 +293,43 @@ class MultiModelEvaluationHarness:
             for topic_data in topics:
                 if task_idx < len(results):
                     result = results[task_idx]
+                    # Results a task produced itself were already streamed to NDJSON
+                    streamed = isinstance(result, dict)
                     
-                    # Handle exceptions
-                    if isinstance(result, Exception):
-                        print(f"❌ {model} | {topic_data['topic'][:50]}... | Error: {result}")
-                        result = {
-                            "success": False,
-                            "error": str(result),
-                            "model": model,
-                            "topic": topic_data["topic"],
-                            "expected_elements": topic_data.get("expected_elements", []),
-                            "duration_s": 0,
-                            "word_count": 0,
-                            "sources_count": 0,
-                            "claims_count": 0,
-                            "citations_count": 0,
-                            "coverage_score": 0.0,
-                            "model_info": self.config.get_available_models_dict().get(model)
-                        }
-                    elif isinstance(result, dict):
-                        # Print results as they come in
-                        if result.get("success", False):
-                            print(f"✅ {model} | {result['topic'][:50]}... | {result['duration_s']:.1f}s | {result['word_count']} words")
-                        else:
-                            print(f"❌ {model} | {result['topic'][:50]}... | {result['error']}")
-                    else:
+                    if isinstance(result, asyncio.CancelledError) and model in self.aborted_models:
+                        # Stopped early because the model kept failing the same way
+                        result = self._failed_pair_result(
+                            model, topic_data,
+                            f"Skipped after {_MAX_CONSECUTIVE_FAILURES} consecutive failures: "
+                            f"{self.aborted_models[model]}"
+                        )
+                    elif isinstance(result, BaseException):
+                        # Handle exceptions
+                        self._enqueue_output(
+                            f"❌ {model} | {short_topic(topic_data['topic'])} | Error: {result}"
+                        )
+                        result = self._failed_pair_result(model, topic_data, str(result))
+                    elif not isinstance(result, dict):
                         # Fallback for unexpected result types
-                        print(f"⚠️ {model} | {topic_data['topic'][:50]}... | Unexpected result type: {type(result)}")
-                        result = {
-                            "success": False,
-                            "error": f"Unexpected result type: {type(result)}",
-                            "model": model,
-                            "topic": topic_data["topic"],
-                            "expected_elements": topic_data.get("expected_elements", []),
-                            "duration_s": 0,
-                            "word_count": 0,
-                            "sources_count": 0,
-                            "claims_count": 0,
-                            "citations_count": 0,
-                            "coverage_score": 0.0,
-                            "model_info": self.config.get_available_models_dict().get(model)
-                        }
+                        self._enqueue_output(
+                            f"⚠️ {model} | {short_topic(topic_data['topic'])} | Unexpected result type: {type(result)}"
+                        )
+                        result = self._failed_pair_result(
+                            model, topic_data, f"Unexpected result type: {type(result)}"
+                        )
                     
+                    if not streamed:
+                        self._enqueue_output(result)
                     model_results[model].append(result)
                     task_idx += 1
         
-        # Calculate comparative metrics
-        total_duration = time.time() - start_time
-        evaluation_summary = self._calculate_comparative_metrics(model_results, total_duration)
-        
-        # Save results
-        self._save_multi_model_results(evaluation_summary)
-        
-        # Print comparative summary
-        self._print_comparative_summary(evaluation_summary)
-        
-        return evaluation_summary
+        return model_results
     
     def _validate_model_selections(self, models: List[str]) -> Dict[str, Any]:
         """Validate that all selected models are available and configured."""
         issues = []
         warnings = []
-        available_models = self.config.get_available_models_dict()
+        available_models = self._models_dict
         
         if not models or len(models) == 0:
             issues.append("No models specified for comparison")
@@ -237,8 +365,8 @@ class MultiModelEvaluationHarness:
                 self._save_topics(default_topics)
                 return default_topics
             
-            with open(self.topics_file, 'r') as f:
-                topics_data = json.load(f)
+            with open(self.topics_file, 'rb') as f:
+                topics_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
             
             return topics_data.get("topics", [])
         
@@ -296,10 +424,10 @@ class MultiModelEvaluationHarness:
             }
         ]
     
-    def _save_topics(self, topics: List[Dict[str, Any]]):
+    def _save_topics(self, topics: List[Dict[str, Any]]) -> None:
         """Save topics to JSON file."""
         try:
-            os.makedirs(os.path.dirname(self.topics_file), exist_ok=True)
+            ensure_dir(os.path.dirname(self.topics_file))
             
             topics_data = {
                 "description": "Evaluation topics for Nova Brief research agent",
@@ -307,8 +435,8 @@ class MultiModelEvaluationHarness:
                 "topics": topics
             }
             
-            with open(self.topics_file, 'w') as f:
-                json.dump(topics_data, f, indent=2)
+            with open(self.topics_file, 'wb') as f:
+                f.write(json_bytes(topics_data, indent=True))
             
             print(f"💾 Created default topics file: {self.topics_file}")
         
@@ -347,8 +475,98 @@ class MultiModelEvaluationHarness:
         result["topic"] = topic
         result["expected_elements"] = expected_elements
         
+        self._print_model_topic_result(result)
+        self._enqueue_output(result)
+        self._track_failures(model, result)
         return result
     
+    def _track_failures(self, model: str, result: Dict[str, Any]) -> None:
+        """
+        Cancel a model's remaining evaluations once it keeps failing with the
+        same configuration or auth error. Transient errors (timeouts, rate
+        limits, server errors) break the streak instead of extending it.
+        """
+        error = str(result.get("error"))
+        if result.get("success", False) or not _is_fatal_error(error):
+            self._failure_streaks.pop(model, None)
+            return
+        
+        last_error, streak = self._failure_streaks.get(model, (None, 0))
+        streak = streak + 1 if error == last_error else 1
+        self._failure_streaks[model] = (error, streak)
+        
+        if streak >= _MAX_CONSECUTIVE_FAILURES and model not in self.aborted_models:
+            self.aborted_models[model] = error
+            current = asyncio.current_task()
+            for task in self._model_tasks.get(model, []):
+                if task is not current and not task.done():
+                    task.cancel()
+    
+    def _failed_pair_result(self, model: str, topic_data: Dict[str, Any], error: str) -> Dict[str, Any]:
+        """Result entry for a (model, topic) evaluation that produced no result of its own."""
+        return {
+            "success": False,
+            "error": error,
+            "model": model,
+            "topic": topic_data["topic"],
+            "expected_elements": topic_data.get("expected_elements", []),
+            "duration_s": 0,
+            "word_count": 0,
+            "sources_count": 0,
+            "claims_count": 0,
+            "citations_count": 0,
+            "coverage_score": 0.0
+        }
+    
+    def _enqueue_output(self, item: Union[str, Dict[str, Any]]) -> None:
+        """Queue a progress line (str) or result record (dict) for _write_output."""
+        if self._output_queue is not None:
+            self._output_queue.put_nowait(item)
+    
+    def _print_model_topic_result(self, result: Dict[str, Any]) -> None:
+        """Queue one model-topic outcome line as soon as it completes."""
+        if result.get("success", False):
+            self._enqueue_output(f"✅ {result['model']} | {short_topic(result['topic'])} | {result['duration_s']:.1f}s | {result['word_count']} words")
+        else:
+            self._enqueue_output(f"❌ {result['model']} | {short_topic(result['topic'])} | {result['error']}")
+    
+    async def _write_output(
+        self,
+        results_file: str,
+        output_queue: "asyncio.Queue[Union[str, Dict[str, Any], None]]"
+    ) -> None:
+        """Write queued progress lines and result records until a None sentinel arrives."""
+        
+        def _write_batch(results_out: BinaryIO, items: List[Union[str, Dict[str, Any]]]) -> None:
+            # Serialized and written here, in the worker thread, so neither
+            # encoding nor file or terminal I/O holds up the event loop
+            lines = [item for item in items if isinstance(item, str)]
+            records = [ndjson_line(item) for item in items if isinstance(item, dict)]
+            if records:
+                results_out.writelines(records)
+                results_out.flush()
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+        
+        with open(results_file, "ab", buffering=NDJSON_BUFFER_SIZE) as results_out:
+            done = False
+            while not done:
+                item = await output_queue.get()
+                if item is None:
+                    break
+                
+                # Drain whatever else is already queued into the same write
+                items = [item]
+                while not output_queue.empty():
+                    item = output_queue.get_nowait()
+                    if item is None:
+                        done = True
+                        break
+                    items.append(item)
+                
+                await asyncio.to_thread(_write_batch, results_out, items)
+    
     async def _evaluate_single_model_topic(
         self,
         model: str,
@@ -358,90 +576,145 @@ class MultiModelEvaluationHarness:
     ) -> Dict[str, Any]:
         """Evaluate research pipeline on a single model-topic combination."""
         
-        topic_start_time = time.time()
+        topic_start_time = time.perf_counter()
         
         try:
-            # Run research pipeline with specified model
-            result = await run_research_pipeline(topic, constraints, selected_model=model)
+            cache_path = self._pipeline_cache_path(model, topic, constraints) if self.use_cache else None
+            outcome = await asyncio.to_thread(read_json_file, cache_path) if cache_path else None
+            cached = outcome is not None
             
-            duration = time.time() - topic_start_time
-            
-            if result["success"]:
-                # Extract metrics from result
-                state = result["state"]
-                report = result["report"]
-                metrics = result["metrics"]
+            if outcome is None:
+                from src.agent.orchestrator import run_research_pipeline
                 
-                # Evaluate content coverage
-                coverage_score = self._evaluate_content_coverage(
-                    report["report_md"],
-                    expected_elements
+                # Run research pipeline with specified model
+                model_config = self._models_dict.get(model)
+                provider = model_config.provider if model_config else "default"
+                sem = self._provider_sems.setdefault(
+                    provider, asyncio.Semaphore(max(1, self.config.PROVIDER_CONCURRENCY))
                 )
+                async with sem:
+                    # Time only the pipeline run, not the wait for a provider slot
+                    topic_start_time = time.perf_counter()
+                    result = await run_research_pipeline(
+                        topic, constraints, selected_model=model,
+                        http_client=self._http_client
+                    )
                 
-                return {
-                    "success": True,
+                duration = time.perf_counter() - topic_start_time
+                
+                if not result["success"]:
+                    return {
+                        "success": False,
+                        "duration_s": duration,
+                        "cached": False,
+                        "error": result["error"],
+                        "word_count": 0,
+                        "sources_count": 0,
+                        "claims_count": 0,
+                        "citations_count": 0,
+                        "coverage_score": 0.0
+                    }
+                
+                # Keep only what scoring needs from the pipeline result
+                state = result["state"]
+                report = result["report"]
+                outcome = {
                     "duration_s": duration,
+                    "report_md": report["report_md"],
                     "word_count": report["word_count"],
-                    "sources_count": metrics["sources_count"],
+                    "sources_count": result["metrics"]["sources_count"],
                     "claims_count": len(state["claims"]),
                     "citations_count": len(state["citations"]),
-                    "coverage_score": coverage_score,
-                    "report_md": report["report_md"],
-                    "model_info": self.config.get_available_models_dict().get(model),
-                    "error": None
-                }
-            else:
-                return {
-                    "success": False,
-                    "duration_s": duration,
-                    "error": result["error"],
-                    "word_count": 0,
-                    "sources_count": 0,
-                    "claims_count": 0,
-                    "citations_count": 0,
-                    "coverage_score": 0.0,
-                    "model_info": self.config.get_available_models_dict().get(model)
+                    "sub_questions": state.get("sub_questions", [])
                 }
+                
+                if cache_path:
+                    ensure_dir(PIPELINE_CACHE_DIR)
+                    await asyncio.to_thread(write_bytes, cache_path, json_bytes(outcome))
+            
+            # Evaluate content coverage
+            coverage_score = self._evaluate_content_coverage(
+                outcome["report_md"],
+                expected_elements
+            )
+            
+            # Keep only a path in the result so the full matrix of reports
+            # is never held in memory or embedded in the results file
+            report_path = await asyncio.to_thread(write_report, outcome["report_md"])
+            
+            return {
+                "success": True,
+                # Cached outcomes report the original pipeline duration so
+                # timing comparisons stay meaningful across re-runs
+                "duration_s": outcome["duration_s"],
+                "cached": cached,
+                "word_count": outcome["word_count"],
+                "sources_count": outcome["sources_count"],
+                "claims_count": outcome["claims_count"],
+                "citations_count": outcome["citations_count"],
+                "coverage_score": coverage_score,
+                "report_path": report_path,
+                "error": None
+            }
         
         except Exception as e:
-            duration = time.time() - topic_start_time
+            duration = time.perf_counter() - topic_start_time
             logger.error(f"Evaluation failed for model '{model}' on topic '{topic}': {e}")
             
             return {
                 "success": False,
                 "duration_s": duration,
+                "cached": False,
                 "error": str(e),
                 "word_count": 0,
                 "sources_count": 0,
                 "claims_count": 0,
                 "citations_count": 0,
-                "coverage_score": 0.0,
-                "model_info": self.config.get_available_models_dict().get(model)
+                "coverage_score": 0.0
             }
     
+    def _pipeline_cache_path(self, model: str, topic: str, constraints: Constraints) -> str:
+        """Cache file for a pipeline run with the given model."""
+        return pipeline_cache_path(topic, constraints, model, self.cache_version)
+    
     def _evaluate_content_coverage(
         self, 
         report_content: str, 
         expected_elements: List[str]
     ) -> float:
         """Evaluate how well the report covers expected elements."""
-        if not expected_elements:
-            return 1.0
-        
-        content_lower = report_content.lower()
-        covered_elements = 0
-        
-        for element in expected_elements:
-            # Simple keyword matching - could be enhanced with semantic similarity
-            element_keywords = element.lower().split()
-            
-            # Check if any significant words from the element appear in content
-            matches = sum(1 for keyword in element_keywords if len(keyword) > 3 and keyword in content_lower)
-            
-            if matches >= len(element_keywords) * 0.5:  # At least 50% of keywords found
-                covered_elements += 1
+        return evaluate_content_coverage(report_content, expected_elements)
+    
+    def _model_metrics(self, model: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summary metrics for one model's topic results."""
+        # One pass counts the successes and accumulates their statistics
+        successful_count, stats = _running_stats(results)
+        
+        if successful_count:
+            # Means and standard deviations for variability metrics
+            avg_duration, duration_std = stats["duration_s"]
+            avg_word_count, word_count_std = stats["word_count"]
+            avg_sources, _ = stats["sources_count"]
+            avg_coverage, coverage_std = stats["coverage_score"]
+        else:
+            avg_duration = avg_word_count = avg_sources = avg_coverage = 0
+            duration_std = word_count_std = coverage_std = 0
         
-        return covered_elements / len(expected_elements)
+        return {
+            "total_topics": len(results),
+            "successful_topics": successful_count,
+            "failed_topics": len(results) - successful_count,
+            "success_rate": successful_count / len(results) * 100 if results else 0,
+            "avg_duration_s": avg_duration,
+            "avg_word_count": avg_word_count,
+            "avg_sources_count": avg_sources,
+            "avg_coverage_score": avg_coverage,
+            "duration_std": duration_std,
+            "word_count_std": word_count_std,
+            "coverage_std": coverage_std,
+            # Stored once per model rather than in every per-topic result
+            "model_info": self._models_dict.get(model)
+        }
     
     def _calculate_comparative_metrics(
         self, 
@@ -453,61 +726,42 @@ class MultiModelEvaluationHarness:
             return {"success": False, "error": "No results to evaluate"}
         
         models = list(model_results.keys())
-        comparative_metrics = {}
         
         # Calculate per-model metrics
-        for model in models:
-            results = model_results[model]
-            successful_runs = [r for r in results if r["success"]]
-            failed_runs = [r for r in results if not r["success"]]
-            
-            if successful_runs:
-                avg_duration = statistics.mean(r["duration_s"] for r in successful_runs)
-                avg_word_count = statistics.mean(r["word_count"] for r in successful_runs)
-                avg_sources = statistics.mean(r["sources_count"] for r in successful_runs)
-                avg_coverage = statistics.mean(r["coverage_score"] for r in successful_runs)
-                
-                # Calculate standard deviations for variability metrics
-                duration_std = statistics.stdev(r["duration_s"] for r in successful_runs) if len(successful_runs) > 1 else 0
-                word_count_std = statistics.stdev(r["word_count"] for r in successful_runs) if len(successful_runs) > 1 else 0
-                coverage_std = statistics.stdev(r["coverage_score"] for r in successful_runs) if len(successful_runs) > 1 else 0
-            else:
-                avg_duration = avg_word_count = avg_sources = avg_coverage = 0
-                duration_std = word_count_std = coverage_std = 0
-            
-            comparative_metrics[model] = {
-                "total_topics": len(results),
-                "successful_topics": len(successful_runs),
-                "failed_topics": len(failed_runs),
-                "success_rate": len(successful_runs) / len(results) * 100 if results else 0,
-                "avg_duration_s": avg_duration,
-                "avg_word_count": avg_word_count,
-                "avg_sources_count": avg_sources,
-                "avg_coverage_score": avg_coverage,
-                "duration_std": duration_std,
-                "word_count_std": word_count_std,
-                "coverage_std": coverage_std,
-                "model_info": successful_runs[0]["model_info"] if successful_runs else None
-            }
+        comparative_metrics = {
+            model: self._model_metrics(model, results)
+            for model, results in model_results.items()
+        }
         
         # Calculate cross-model comparative statistics
-        all_successful = []
-        for results in model_results.values():
-            all_successful.extend([r for r in results if r["success"]])
+        any_successful = any(m["successful_topics"] for m in comparative_metrics.values())
         
         cross_model_stats = {}
-        if all_successful:
+        if any_successful:
+            # Pull each model's ranking keys out once; the sorts then compare
+            # plain tuples through a C-level itemgetter
+            items = [
+                (
+                    m,
+                    comparative_metrics[m]["avg_duration_s"],
+                    comparative_metrics[m]["avg_coverage_score"],
+                    comparative_metrics[m]["success_rate"],
+                    comparative_metrics[m]["avg_word_count"]
+                )
+                for m in models
+            ]
+            
             # Speed comparison (lower is better)
-            speed_ranking = sorted(models, key=lambda m: comparative_metrics[m]["avg_duration_s"])
+            speed_ranking = [item[0] for item in sorted(items, key=itemgetter(1))]
             
             # Quality comparison (higher coverage is better)
-            quality_ranking = sorted(models, key=lambda m: comparative_metrics[m]["avg_coverage_score"], reverse=True)
+            quality_ranking = [item[0] for item in sorted(items, key=itemgetter(2), reverse=True)]
             
             # Reliability comparison (higher success rate is better)
-            reliability_ranking = sorted(models, key=lambda m: comparative_metrics[m]["success_rate"], reverse=True)
+            reliability_ranking = [item[0] for item in sorted(items, key=itemgetter(3), reverse=True)]
             
             # Word count comparison (for verbosity analysis)
-            verbosity_ranking = sorted(models, key=lambda m: comparative_metrics[m]["avg_word_count"], reverse=True)
+            verbosity_ranking = [item[0] for item in sorted(items, key=itemgetter(4), reverse=True)]
             
             cross_model_stats = {
                 "speed_ranking": speed_ranking,
@@ -522,85 +776,88 @@ class MultiModelEvaluationHarness:
             "models_evaluated": models,
             "model_metrics": comparative_metrics,
             "cross_model_stats": cross_model_stats,
+            "aborted_models": dict(self.aborted_models),
             "detailed_results": model_results
         }
     
-    def _save_multi_model_results(self, evaluation_summary: Dict[str, Any]):
+    def _save_multi_model_results(self, evaluation_summary: Dict[str, Any]) -> None:
         """Save multi-model evaluation results to file."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            results_file = f"eval/multi_model_results_{timestamp}.json"
+            results_file = os.path.join(_HERE, f"multi_model_results_{self._run_stamp}.json")
             
-            os.makedirs(os.path.dirname(results_file), exist_ok=True)
+            ensure_dir(os.path.dirname(results_file))
             
-            with open(results_file, 'w') as f:
-                json.dump(evaluation_summary, f, indent=2, default=str)
+            with open(results_file, 'wb') as f:
+                f.write(json_bytes(evaluation_summary, indent=True))
             
             print(f"💾 Multi-model results saved to: {results_file}")
+            print(f"💾 Per-pair results: {evaluation_summary['results_file']}")
         
         except Exception as e:
             print(f"⚠️  Could not save results: {e}")
     
-    def _print_comparative_summary(self, summary: Dict[str, Any]):
-        """Print multi-model comparative summary."""
-        print(f"\n{'='*60}")
-        print("📊 MULTI-MODEL EVALUATION SUMMARY")
-        print("=" * 60)
+    def _print_comparative_summary(self, summary: Dict[str, Any]) -> None:
+        """Print multi-model comparative summary, collected into lines and written with one print."""
+        lines = [f"\n{'='*60}", "📊 MULTI-MODEL EVALUATION SUMMARY", "=" * 60]
         
         if not summary["success"]:
-            print(f"❌ Evaluation failed: {summary.get('error')}")
+            lines.append(f"❌ Evaluation failed: {summary.get('error')}")
+            print("\n".join(lines))
             return
         
         models = summary["models_evaluated"]
-        print(f"Models Evaluated: {len(models)}")
-        print(f"Total Duration: {summary['total_duration_s']:.1f}s")
+        lines.append(f"Models Evaluated: {len(models)}")
+        lines.append(f"Total Duration: {summary['total_duration_s']:.1f}s")
         
-        # Print per-model summary
-        print(f"\n📋 Per-Model Performance:")
+        # Per-model summary
+        lines.append(f"\n📋 Per-Model Performance:")
         model_metrics = summary["model_metrics"]
         
         for model in models:
             metrics = model_metrics[model]
-            print(f"\n🤖 {model}")
+            lines.append(f"\n🤖 {model}")
             if metrics["model_info"]:
-                print(f"     Provider: {metrics['model_info'].provider}")
-                print(f"     Display: {metrics['model_info'].display_name}")
-            print(f"     Success Rate: {metrics['success_rate']:.1f}% ({metrics['successful_topics']}/{metrics['total_topics']})")
+                lines.append(f"     Provider: {metrics['model_info'].provider}")
+                lines.append(f"     Display: {metrics['model_info'].display_name}")
+            lines.append(f"     Success Rate: {metrics['success_rate']:.1f}% ({metrics['successful_topics']}/{metrics['total_topics']})")
             if metrics['successful_topics'] > 0:
-                print(f"     Avg Duration: {metrics['avg_duration_s']:.1f}s (±{metrics['duration_std']:.1f}s)")
-                print(f"     Avg Word Count: {metrics['avg_word_count']:.0f} (±{metrics['word_count_std']:.0f})")
-                print(f"     Avg Sources: {metrics['avg_sources_count']:.1f}")
-                print(f"     Avg Coverage: {metrics['avg_coverage_score']:.1%} (±{metrics['coverage_std']:.1%})")
+                lines.append(f"     Avg Duration: {metrics['avg_duration_s']:.1f}s (±{metrics['duration_std']:.1f}s)")
+                lines.append(f"     Avg Word Count: {metrics['avg_word_count']:.0f} (±{metrics['word_count_std']:.0f})")
+                lines.append(f"     Avg Sources: {metrics['avg_sources_count']:.1f}")
+                lines.append(f"     Avg Coverage: {metrics['avg_coverage_score']:.1%} (±{metrics['coverage_std']:.1%})")
         
-        # Print comparative rankings
+        # Comparative rankings
         if "cross_model_stats" in summary and summary["cross_model_stats"]:
             stats = summary["cross_model_stats"]
-            print(f"\n🏆 Comparative Rankings:")
+            lines.append(f"\n🏆 Comparative Rankings:")
             
-            print(f"🚀 Speed (Fastest to Slowest):")
+            lines.append(f"🚀 Speed (Fastest to Slowest):")
             for i, model in enumerate(stats["speed_ranking"], 1):
                 duration = model_metrics[model]["avg_duration_s"]
-                print(f"     {i}. {model}: {duration:.1f}s")
+                lines.append(f"     {i}. {model}: {duration:.1f}s")
             
-            print(f"🎯 Quality (Best to Worst Coverage):")
+            lines.append(f"🎯 Quality (Best to Worst Coverage):")
             for i, model in enumerate(stats["quality_ranking"], 1):
                 coverage = model_metrics[model]["avg_coverage_score"]
-                print(f"     {i}. {model}: {coverage:.1%}")
+                lines.append(f"     {i}. {model}: {coverage:.1%}")
             
-            print(f"🛡️  Reliability (Most to Least Successful):")
+            lines.append(f"🛡️  Reliability (Most to Least Successful):")
             for i, model in enumerate(stats["reliability_ranking"], 1):
                 success_rate = model_metrics[model]["success_rate"]
-                print(f"     {i}. {model}: {success_rate:.1f}%")
+                lines.append(f"     {i}. {model}: {success_rate:.1f}%")
             
-            print(f"📝 Verbosity (Most to Least Words):")
+            lines.append(f"📝 Verbosity (Most to Least Words):")
             for i, model in enumerate(stats["verbosity_ranking"], 1):
                 word_count = model_metrics[model]["avg_word_count"]
-                print(f"     {i}. {model}: {word_count:.0f} words")
+                lines.append(f"     {i}. {model}: {word_count:.0f} words")
+        
+        print("\n".join(lines))
 
 
-async def main():
+async def main() -> bool:
     """Main multi-model evaluation function."""
     import argparse
+    import statistics
     
     parser = argparse.ArgumentParser(description="Nova Brief Multi-Model Evaluation Harness")
     parser.add_argument("--models", nargs="+", help="List of model keys to compare (1-5 models)")
@@ -610,6 +867,10 @@ async def main():
     parser.add_argument("--max-topics", type=int, help="Maximum number of topics to evaluate")
     parser.add_argument("--topics-file", default="eval/topics.json", help="Topics file path")
     parser.add_argument("--list-models", action="store_true", help="List available models and exit")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always run the research pipeline instead of reusing cached outcomes")
+    parser.add_argument("--cache-version", default="1",
+                       help="Salt for pipeline cache keys; change it to invalidate cached outcomes")
     
     args = parser.parse_args()
     
@@ -633,7 +894,11 @@ async def main():
         return False
     
     # Run multi-model evaluation
-    harness = MultiModelEvaluationHarness(args.topics_file)
+    harness = MultiModelEvaluationHarness(
+        args.topics_file,
+        use_cache=not args.no_cache,
+        cache_version=args.cache_version
+    )
     
     try:
         summary = await harness.run_multi_model_evaluation(
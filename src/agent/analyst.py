@@ -1,15 +1,38 @@
 """Analyst component for synthesizing information and extracting claims."""
 
+import asyncio
 import uuid
 import json
-from typing import Dict, List, Any
-from ..providers.openrouter_client import chat, create_json_schema_format
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+from ..providers.openrouter_client import LLMClient, chat, create_json_schema_format, use_client
 from ..storage.models import Document, Chunk, Claim, Citation
+from ..tools.url_utils import extract_domain
 from ..observability.logging import get_logger
 from ..observability.tracing import TimedOperation, emit_event
 
 logger = get_logger(__name__)
 
+# JSON extraction patterns used by _parse_json_response
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_CODE_BLOCK_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL | re.IGNORECASE)
+_CLAIMS_OBJECT_RE = re.compile(r'\{[^}]*"claims"[^}]*\}', re.DOTALL)
+
+# Sections _create_draft_sections adds itself (by claim type, plus the conclusion)
+_STANDARD_SECTIONS = (
+    "Key Facts and Findings",
+    "Current Estimates and Projections",
+    "Expert Opinions and Analysis",
+    "Summary and Implications"
+)
+
 
 ANALYSIS_SYSTEM_PROMPT = """You are a research analyst expert at synthesizing information from multiple sources. Your task is to:
 
@@ -47,7 +70,10 @@ async def analyze(
     documents: List[Document],
     chunks: List[Chunk],
     sub_questions: List[str],
-    topic: str
+    topic: str,
+    concurrency: int = 4,
+    model_key: Optional[str] = None,
+    client: Optional[LLMClient] = None
 ) -> Dict[str, Any]:
     """
     Analyze documents and chunks to extract claims and draft sections.
@@ -57,6 +83,10 @@ async def analyze(
         chunks: List of text chunks for analysis
         sub_questions: Research sub-questions to address
         topic: Main research topic
+        concurrency: Maximum number of document batches analyzed at once
+        model_key: Model to analyze with; defaults to the globally selected model
+        client: Shared LLM client to analyze with; one is created (and
+            closed) for this call if not given
     
     Returns:
         Dictionary with success status, claims, citations, and draft sections
@@ -85,16 +115,29 @@ async def analyze(
             batch_size = 5  # Process 5 documents at a time
             doc_urls = list(chunks_by_doc.keys())
             
-            for i in range(0, len(doc_urls), batch_size):
-                batch_urls = doc_urls[i:i + batch_size]
-                batch_result = await _analyze_document_batch(
-                    batch_urls, 
-                    chunks_by_doc, 
-                    documents,
-                    sub_questions, 
-                    topic
-                )
+            # Batches are independent LLM calls, so run them concurrently
+            # (bounded) and merge in batch order. They share one client so the
+            # HTTP connection pool is reused rather than rebuilt per batch
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            
+            async with use_client(client, model_key) as llm_client:
+                async def _analyze_batch(batch_urls: List[str]) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await _analyze_document_batch(
+                            batch_urls,
+                            chunks_by_doc,
+                            documents,
+                            sub_questions,
+                            topic,
+                            client=llm_client
+                        )
                 
+                batch_results = await asyncio.gather(*[
+                    _analyze_batch(doc_urls[i:i + batch_size])
+                    for i in range(0, len(doc_urls), batch_size)
+                ])
+            
+            for batch_result in batch_results:
                 if batch_result["success"]:
                     all_claims.extend(batch_result["claims"])
                     all_citations.extend(batch_result["citations"])
@@ -113,24 +156,14 @@ async def analyze(
             avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
             
             # Count claims by type
-            claim_types = {}
-            for claim in final_claims:
-                claim_type = claim["type"]
-                claim_types[claim_type] = claim_types.get(claim_type, 0) + 1
+            claim_types = dict(Counter(claim["type"] for claim in final_claims))
             
             # Calculate source diversity
             all_source_urls = set()
             for citation in final_citations:
                 all_source_urls.update(citation["urls"])
             
-            source_domains = set()
-            for url in all_source_urls:
-                try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(url).netloc
-                    source_domains.add(domain)
-                except Exception:
-                    continue
+            source_domains = {extract_domain(url) for url in all_source_urls}
             
             metadata = {
                 "documents_analyzed": len(documents),
@@ -158,6 +191,7 @@ async def analyze(
                 "claims": final_claims,
                 "citations": final_citations,
                 "draft_sections": draft_sections,
+                "sections": all_sections,
                 "metadata": metadata
             }
             
@@ -183,12 +217,63 @@ async def analyze(
             }
 
 
+def merge_analyses(results: List[Dict[str, Any]], topic: str) -> Dict[str, Any]:
+    """
+    Merge the results of several analyze() calls into one analysis.
+    
+    Used when documents are analyzed in batches as they are read, so claims
+    from different batches are deduplicated and draft sections are rebuilt
+    over the combined claim set.
+    
+    Args:
+        results: Results returned by analyze() for each batch
+        topic: Main research topic
+    
+    Returns:
+        Dictionary with success status, claims, citations, and draft sections
+    """
+    successful = [r for r in results if r.get("success")]
+    if not successful:
+        errors = [r["error"] for r in results if r.get("error")]
+        return {
+            "success": False,
+            "error": "; ".join(errors) if errors else "No analysis results to merge",
+            "claims": [],
+            "citations": [],
+            "draft_sections": []
+        }
+    
+    all_claims: List[Claim] = []
+    all_citations: List[Citation] = []
+    all_sections: List[str] = []
+    for result in successful:
+        all_claims.extend(result["claims"])
+        all_citations.extend(result["citations"])
+        all_sections.extend(result.get("sections", []))
+    
+    final_claims, final_citations = _deduplicate_claims(all_claims, all_citations)
+    
+    return {
+        "success": True,
+        "claims": final_claims,
+        "citations": final_citations,
+        "draft_sections": _create_draft_sections(final_claims, all_sections, topic)
+    }
+
+
+@lru_cache(maxsize=64)
+def _sub_questions_block(sub_questions: Tuple[str, ...]) -> str:
+    """Bulleted sub-question list for analysis prompts; shared by every batch of a run."""
+    return "\n".join([f"- {q}" for q in sub_questions])
+
+
 async def _analyze_document_batch(
     doc_urls: List[str],
     chunks_by_doc: Dict[str, List[Chunk]],
     documents: List[Document],
     sub_questions: List[str],
-    topic: str
+    topic: str,
+    client: Optional[LLMClient] = None
 ) -> Dict[str, Any]:
     """Analyze a batch of documents using LLM."""
     try:
@@ -216,16 +301,17 @@ async def _analyze_document_batch(
             })
         
         # Prepare analysis prompt
-        content_text = ""
-        for i, doc_summary in enumerate(doc_summaries, 1):
-            content_text += f"\n=== Source {i}: {doc_summary['title']} ===\n"
-            content_text += f"URL: {doc_summary['url']}\n"
-            content_text += f"Content: {doc_summary['content']}\n"
+        content_text = "".join([
+            f"\n=== Source {i}: {doc_summary['title']} ===\n"
+            f"URL: {doc_summary['url']}\n"
+            f"Content: {doc_summary['content']}\n"
+            for i, doc_summary in enumerate(doc_summaries, 1)
+        ])
         
         user_prompt = f"""Research Topic: {topic}
 
 Sub-questions to address:
-{chr(10).join(f"- {q}" for q in sub_questions)}
+{_sub_questions_block(tuple(sub_questions))}
 
 Source Content:
 {content_text}
@@ -272,7 +358,10 @@ Extract specific claims from this content, focusing on verifiable facts, estimat
         response = await chat(
             messages=messages,
             temperature=0.1,
-            max_tokens=2000
+            max_tokens=2000,
+            client=client,
+            # Extraction from the same documents is reused across eval runs
+            cacheable=True
         )
         
         if not response["success"]:
@@ -372,13 +461,10 @@ Extract specific claims from this content, focusing on verifiable facts, estimat
 
 def _group_chunks_by_document(chunks: List[Chunk]) -> Dict[str, List[Chunk]]:
     """Group chunks by their source document URL."""
-    grouped = {}
+    grouped = defaultdict(list)
     for chunk in chunks:
-        doc_url = chunk["doc_url"]
-        if doc_url not in grouped:
-            grouped[doc_url] = []
-        grouped[doc_url].append(chunk)
-    return grouped
+        grouped[chunk["doc_url"]].append(chunk)
+    return dict(grouped)
 
 
 def _deduplicate_claims(claims: List[Claim], citations: List[Citation]) -> tuple[List[Claim], List[Citation]]:
@@ -429,6 +515,33 @@ def _texts_are_similar(text1: str, text2: str, threshold: float = 0.8) -> bool:
     return similarity >= threshold
 
 
+def merge_draft_sections(
+    claims: List[Claim],
+    previous_sections: List[str],
+    new_sections: List[str],
+    topic: str
+) -> List[str]:
+    """
+    Rebuild draft sections for a multi-round run.
+    
+    Each round only analyzes its new documents, so its draft sections reflect
+    just those claims. Suggested themes from earlier rounds are kept (ahead of
+    the new ones) and the standard sections are rederived from all claims.
+    
+    Args:
+        claims: All claims accumulated so far
+        previous_sections: Draft sections from earlier rounds
+        new_sections: Draft sections from the current round
+        topic: Main research topic
+    
+    Returns:
+        Merged list of draft sections
+    """
+    generated = {f"Introduction to {topic}", *_STANDARD_SECTIONS}
+    suggested = [s for s in previous_sections + new_sections if s not in generated]
+    return _create_draft_sections(claims, suggested, topic)
+
+
 def _create_draft_sections(claims: List[Claim], sections: List[str], topic: str) -> List[str]:
     """Create structured draft sections from claims and suggested sections."""
     # Combine and deduplicate section suggestions
@@ -443,15 +556,15 @@ def _create_draft_sections(claims: List[Claim], sections: List[str], topic: str)
             all_sections.append(section)
     
     # Add standard sections based on claim types
-    fact_claims = [c for c in claims if c["type"] == "fact"]
-    estimate_claims = [c for c in claims if c["type"] == "estimate"]
-    opinion_claims = [c for c in claims if c["type"] == "opinion"]
+    # Only presence matters, so collect the types in one pass instead of
+    # materializing a filtered list per type
+    claim_types = {c["type"] for c in claims}
     
-    if fact_claims:
+    if "fact" in claim_types:
         all_sections.append("Key Facts and Findings")
-    if estimate_claims:
+    if "estimate" in claim_types:
         all_sections.append("Current Estimates and Projections")
-    if opinion_claims:
+    if "opinion" in claim_types:
         all_sections.append("Expert Opinions and Analysis")
     
     # Add conclusion
@@ -468,23 +581,21 @@ def _create_draft_sections(claims: List[Claim], sections: List[str], topic: str)
 
 def _parse_json_response(content: str) -> Dict[str, Any]:
     """Parse JSON response using multiple strategies."""
-    import re
-    
     # Strategy 1: Try to extract and parse JSON as-is
     json_content = content.strip()
     
     # Look for JSON object boundaries if there's extra text
     if not json_content.startswith('{'):
         # Try to find JSON in the content
-        json_match = re.search(r'\{.*\}', json_content, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(json_content)
         if json_match:
             json_content = json_match.group(0)
         else:
             raise ValueError("No JSON object found in response")
     
-    # Strategy 1: Parse as-is
+    # Strategy 1: Parse as-is (orjson's decode error subclasses json's)
     try:
-        return json.loads(json_content)
+        return orjson.loads(json_content) if orjson is not None else json.loads(json_content)
     except json.JSONDecodeError as e:
         logger.warning(f"Initial JSON parse failed, attempting repair: {e}")
     
@@ -497,13 +608,13 @@ def _parse_json_response(content: str) -> Dict[str, Any]:
     
     # Strategy 3: Try to extract JSON from markdown code blocks
     try:
-        code_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL | re.IGNORECASE)
+        code_block_match = _CODE_BLOCK_JSON_RE.search(content)
         if code_block_match:
             json_content = code_block_match.group(1)
             return json.loads(json_content)
         
         # Also try without code block markers
-        json_match = re.search(r'\{[^}]*"claims"[^}]*\}', content, re.DOTALL)
+        json_match = _CLAIMS_OBJECT_RE.search(content)
         if json_match:
             json_content = json_match.group(0)
             return json.loads(json_content)
@@ -552,7 +663,6 @@ def _parse_json_response(content: str) -> Dict[str, Any]:
 
 def _repair_json(json_content: str) -> str:
     """Attempt to repair common JSON formatting issues."""
-    import re
     
     logger.debug(f"Attempting to repair JSON content: {json_content[:200]}...")
     
@@ -626,7 +736,6 @@ def _repair_json(json_content: str) -> str:
 
 def _extract_claims_fallback(content: str, doc_urls: List[str]) -> Dict[str, Any]:
     """Fallback method to extract claims using regex when JSON parsing fails."""
-    import re
     
     claims = []
     citations = []
@@ -1,11 +1,16 @@
 """Agent orchestrator that coordinates the complete research pipeline."""
 
+import asyncio
 import time
-from typing import Dict, List, Any, Optional, Callable
+from concurrent.futures import Executor
+from typing import Awaitable, Dict, List, Any, Optional, Callable
+import httpx
 from ..storage.models import (
     ResearchState, create_initial_state, create_default_constraints,
     Constraints, SearchResult, Document, Chunk, Claim, Citation, Report
 )
+from ..storage.cache import LFUCache
+from ..providers.openrouter_client import LLMClient
 from . import planner, searcher, reader, analyst, verifier, writer
 from ..observability.logging import get_logger
 from ..observability.tracing import TimedOperation, emit_event
@@ -18,7 +23,12 @@ async def run_research_pipeline(
     constraints: Optional[Constraints] = None,
     selected_model: Optional[str] = None,
     max_rounds: int = 3,
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    search_cache: Optional[LFUCache] = None,
+    fetch_cache: Optional[LFUCache] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+    stage_timeouts: Optional[Dict[str, float]] = None,
+    cpu_executor: Optional[Executor] = None
 ) -> Dict[str, Any]:
     """
     Execute the complete research pipeline.
@@ -29,12 +39,20 @@ async def run_research_pipeline(
         selected_model: Model key for LLM selection
         max_rounds: Maximum rounds of iterative refinement
         progress_callback: Optional callback function called with state updates
+        search_cache: Optional per-query search result cache shared across runs
+        fetch_cache: Optional fetched-URL cache shared across runs
+        http_client: Optional pooled HTTP client for fetching and URL checks
+        stage_timeouts: Optional per-stage time budgets in seconds, keyed by
+            "planning", "searching", "reading" (reading plus analysis),
+            "verifying" and "writing"; unlisted stages are unbounded
+        cpu_executor: Optional executor (e.g. a process pool) for CPU-bound
+            post-processing such as claim deduplication
     
     Returns:
         Dictionary with final report, state, and metrics
     """
     with TimedOperation("research_pipeline") as timer:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Initialize research state
@@ -55,8 +73,14 @@ async def run_research_pipeline(
                 "selected_model": selected_model
             })
             
-            # Execute pipeline stages
-            pipeline_result = await _execute_pipeline_stages(state, progress_callback)
+            # One LLM client (and connection pool) for every stage of this
+            # run, closed when the run ends however it ends
+            async with LLMClient(model_key=selected_model) as llm_client:
+                # Execute pipeline stages
+                pipeline_result = await _execute_pipeline_stages(
+                    state, progress_callback, search_cache, fetch_cache, http_client,
+                    stage_timeouts, cpu_executor, llm_client
+                )
             
             if not pipeline_result["success"]:
                 return {
@@ -67,7 +91,7 @@ async def run_research_pipeline(
                 }
             
             # Calculate final metrics
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration_s = end_time - start_time
             
             state["metrics"]["duration_s"] = duration_s
@@ -125,10 +149,31 @@ async def run_research_pipeline(
             }
 
 
-async def _execute_pipeline_stages(state: ResearchState, progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
+async def _execute_pipeline_stages(
+    state: ResearchState,
+    progress_callback: Optional[Callable] = None,
+    search_cache: Optional[LFUCache] = None,
+    fetch_cache: Optional[LFUCache] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+    stage_timeouts: Optional[Dict[str, float]] = None,
+    cpu_executor: Optional[Executor] = None,
+    llm_client: Optional[LLMClient] = None
+) -> Dict[str, Any]:
     """Execute all pipeline stages with iterative refinement."""
     
-    def _notify_progress():
+    async def _bounded(stage: str, stage_coro: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Await a stage, failing it if it exceeds its time budget."""
+        timeout = (stage_timeouts or {}).get(stage)
+        if not timeout:
+            return await stage_coro
+        try:
+            return await asyncio.wait_for(stage_coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Stage '{stage}' exceeded its {timeout:g}s budget")
+            emit_event("stage_timeout", metadata={"stage": stage, "timeout_s": timeout})
+            return {"success": False, "error": f"TIMEOUT: {stage} stage exceeded {timeout:g}s"}
+    
+    def _notify_progress() -> None:
         """Notify UI of progress updates."""
         if progress_callback:
             try:
@@ -140,7 +185,9 @@ async def _execute_pipeline_stages(state: ResearchState, progress_callback: Opti
         max_rounds = state["constraints"]["max_rounds"]
         
         # Stage 1: Planning
-        planning_result = await _execute_planning_stage(state, _notify_progress)
+        planning_result = await _bounded(
+            "planning", _execute_planning_stage(state, _notify_progress, llm_client)
+        )
         if not planning_result["success"]:
             return planning_result
         
@@ -150,25 +197,29 @@ async def _execute_pipeline_stages(state: ResearchState, progress_callback: Opti
             logger.info(f"Starting research round {round_num}/{max_rounds}")
             
             # Stage 2: Search
-            search_result = await _execute_search_stage(state, _notify_progress)
+            search_result = await _bounded(
+                "searching", _execute_search_stage(state, _notify_progress, search_cache)
+            )
             if not search_result["success"]:
                 logger.warning(f"Search failed in round {round_num}: {search_result.get('error')}")
                 continue
             
-            # Stage 3: Reading
-            reading_result = await _execute_reading_stage(state, _notify_progress)
-            if not reading_result["success"]:
-                logger.warning(f"Reading failed in round {round_num}: {reading_result.get('error')}")
-                continue
-            
-            # Stage 4: Analysis
-            analysis_result = await _execute_analysis_stage(state, _notify_progress)
+            # Stages 3-4: Reading and analysis, pipelined so the analyst starts
+            # on the first documents while the remaining URLs are still fetched
+            analysis_result = await _bounded(
+                "reading",
+                _execute_reading_and_analysis_stage(
+                    state, _notify_progress, fetch_cache, http_client, cpu_executor, llm_client
+                )
+            )
             if not analysis_result["success"]:
-                logger.warning(f"Analysis failed in round {round_num}: {analysis_result.get('error')}")
+                logger.warning(f"Reading/analysis failed in round {round_num}: {analysis_result.get('error')}")
                 continue
             
             # Stage 5: Verification
-            verification_result = await _execute_verification_stage(state, _notify_progress)
+            verification_result = await _bounded(
+                "verifying", _execute_verification_stage(state, _notify_progress, http_client)
+            )
             if not verification_result["success"]:
                 logger.warning(f"Verification failed in round {round_num}: {verification_result.get('error')}")
                 continue
@@ -188,7 +239,9 @@ async def _execute_pipeline_stages(state: ResearchState, progress_callback: Opti
                 logger.info(f"Added {len(follow_up_queries[:3])} follow-up queries for round {round_num + 1}")
         
         # Stage 6: Writing (final stage)
-        writing_result = await _execute_writing_stage(state, _notify_progress)
+        writing_result = await _bounded(
+            "writing", _execute_writing_stage(state, _notify_progress, llm_client)
+        )
         if not writing_result["success"]:
             return {
                 "success": False,
@@ -209,7 +262,11 @@ async def _execute_pipeline_stages(state: ResearchState, progress_callback: Opti
         }
 
 
-async def _execute_planning_stage(state: ResearchState, notify_progress: Optional[Callable] = None) -> Dict[str, Any]:
+async def _execute_planning_stage(
+    state: ResearchState,
+    notify_progress: Optional[Callable] = None,
+    llm_client: Optional[LLMClient] = None
+) -> Dict[str, Any]:
     """Execute planning stage."""
     try:
         state["status"] = "planning"
@@ -218,7 +275,10 @@ async def _execute_planning_stage(state: ResearchState, notify_progress: Optiona
             notify_progress()
         emit_event("stage_started", metadata={"stage": "planning", "topic": state["topic"]})
         
-        result = await planner.plan(state["topic"], state["constraints"])
+        result = await planner.plan(
+            state["topic"], state["constraints"], model_key=state.get("selected_model"),
+            client=llm_client
+        )
         
         if result["success"]:
             state["sub_questions"] = result["sub_questions"]
@@ -239,7 +299,11 @@ async def _execute_planning_stage(state: ResearchState, notify_progress: Optiona
         return {"success": False, "error": str(e)}
 
 
-async def _execute_search_stage(state: ResearchState, notify_progress: Optional[Callable] = None) -> Dict[str, Any]:
+async def _execute_search_stage(
+    state: ResearchState,
+    notify_progress: Optional[Callable] = None,
+    cache: Optional[LFUCache] = None
+) -> Dict[str, Any]:
     """Execute search stage."""
     try:
         state["status"] = "searching"
@@ -248,7 +312,7 @@ async def _execute_search_stage(state: ResearchState, notify_progress: Optional[
             notify_progress()
         emit_event("stage_started", metadata={"stage": "searching", "queries": len(state["queries"])})
         
-        result = await searcher.search(state["queries"], state["constraints"])
+        result = await searcher.search(state["queries"], state["constraints"], cache=cache)
         
         if result["success"]:
             # Merge with existing search results (for multi-round research)
@@ -271,8 +335,17 @@ async def _execute_search_stage(state: ResearchState, notify_progress: Optional[
         return {"success": False, "error": str(e)}
 
 
-async def _execute_reading_stage(state: ResearchState, notify_progress: Optional[Callable] = None) -> Dict[str, Any]:
-    """Execute reading stage."""
+async def _execute_reading_and_analysis_stage(
+    state: ResearchState,
+    notify_progress: Optional[Callable] = None,
+    cache: Optional[LFUCache] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+    cpu_executor: Optional[Executor] = None,
+    llm_client: Optional[LLMClient] = None
+) -> Dict[str, Any]:
+    """Execute reading and analysis stages as a producer/consumer pipeline."""
+    analysis_tasks = []
+    batches = None
     try:
         state["status"] = "reading"
         state["progress_percent"] = 0.5  # Stage 1.5: Reading progress
@@ -280,53 +353,69 @@ async def _execute_reading_stage(state: ResearchState, notify_progress: Optional
             notify_progress()
         emit_event("stage_started", metadata={"stage": "reading", "urls": len(state["search_results"])})
         
-        # Stage 1.5: Pass state to reader for partial failures tracking
-        result = await reader.read(state["search_results"], state["constraints"], state)
+        existing_doc_urls = {d["url"] for d in state["documents"]}
+        new_documents_count = 0
+        new_chunks_count = 0
         
-        if result["success"]:
-            # Merge with existing documents and chunks
-            new_documents = result["documents"]
-            new_chunks = result["chunks"]
-            
-            existing_doc_urls = {d["url"] for d in state["documents"]}
+        # Stage 1.5: Pass state to reader for partial failures tracking
+        batches = reader.read_batches(
+            state["search_results"], state["constraints"], state,
+            cache=cache, http_client=http_client
+        )
+        async for batch in batches:
+            if not batch["success"]:
+                return {"success": False, "error": batch.get("error")}
             
-            for doc in new_documents:
-                if doc["url"] not in existing_doc_urls:
-                    state["documents"].append(doc)
+            # Merge with existing documents and chunks (only new documents are analyzed)
+            new_documents = [d for d in batch["documents"] if d["url"] not in existing_doc_urls]
+            new_doc_urls = {d["url"] for d in new_documents}
+            new_chunks = [c for c in batch["chunks"] if c["doc_url"] in new_doc_urls]
             
+            existing_doc_urls.update(new_doc_urls)
+            state["documents"].extend(new_documents)
             state["chunks"].extend(new_chunks)
+            new_documents_count += len(new_documents)
+            new_chunks_count += len(new_chunks)
             
             # Update metrics
-            state["metrics"]["urls_fetched"] += result["metadata"].get("successful_fetches", 0)
-            state["metrics"]["urls_failed"] += result["metadata"].get("failed_fetches", 0)
-            
-            logger.info(f"Reading completed: {len(new_documents)} documents, {len(new_chunks)} chunks")
-            emit_event("stage_completed", metadata={"stage": "reading", "documents_count": len(new_documents)})
-            
-            return {"success": True}
-        else:
-            return {"success": False, "error": result.get("error")}
-            
-    except Exception as e:
-        logger.error(f"Reading stage failed: {e}")
-        return {"success": False, "error": str(e)}
-
-
-async def _execute_analysis_stage(state: ResearchState, notify_progress: Optional[Callable] = None) -> Dict[str, Any]:
-    """Execute analysis stage."""
-    try:
+            state["metrics"]["urls_fetched"] += batch["metadata"].get("successful_fetches", 0)
+            state["metrics"]["urls_failed"] += batch["metadata"].get("failed_fetches", 0)
+            
+            if new_chunks:
+                analysis_tasks.append(asyncio.create_task(analyst.analyze(
+                    new_documents,
+                    new_chunks,
+                    state["sub_questions"],
+                    state["topic"],
+                    model_key=state.get("selected_model"),
+                    client=llm_client
+                )))
+        
+        logger.info(f"Reading completed: {new_documents_count} documents, {new_chunks_count} chunks")
+        emit_event("stage_completed", metadata={"stage": "reading", "documents_count": new_documents_count})
+        
         state["status"] = "analyzing"
         state["progress_percent"] = 0.7  # Stage 1.5: Analyzing progress
         if notify_progress:
             notify_progress()
-        emit_event("stage_started", metadata={"stage": "analyzing", "chunks": len(state["chunks"])})
+        emit_event("stage_started", metadata={"stage": "analyzing", "chunks": new_chunks_count})
         
-        result = await analyst.analyze(
-            state["documents"],
-            state["chunks"],
-            state["sub_questions"],
-            state["topic"]
-        )
+        if not analysis_tasks:
+            # Every URL this round was already read in an earlier one; that is
+            # not a failure, there is just nothing new to analyze
+            logger.info("Analysis skipped: no new documents this round")
+            emit_event("stage_completed", metadata={"stage": "analyzing", "claims_count": 0})
+            return {"success": True}
+        
+        analyses = await asyncio.gather(*analysis_tasks)
+        if cpu_executor is not None:
+            # Claim deduplication is pure Python and quadratic in the claim count;
+            # run it off the event loop so concurrent pipelines keep progressing
+            result = await asyncio.get_running_loop().run_in_executor(
+                cpu_executor, analyst.merge_analyses, analyses, state["topic"]
+            )
+        else:
+            result = analyst.merge_analyses(analyses, state["topic"])
         
         if result["success"]:
             # Merge with existing claims and citations
@@ -341,7 +430,11 @@ async def _execute_analysis_stage(state: ResearchState, notify_progress: Optiona
                     state["claims"].append(claim)
             
             state["citations"].extend(new_citations)
-            state["draft_sections"] = result["draft_sections"]
+            # This round only analyzed its new documents, so rebuild the sections
+            # over all claims rather than replacing earlier rounds' sections
+            state["draft_sections"] = analyst.merge_draft_sections(
+                state["claims"], state["draft_sections"], result["draft_sections"], state["topic"]
+            )
             
             logger.info(f"Analysis completed: {len(new_claims)} new claims, {len(state['claims'])} total")
             emit_event("stage_completed", metadata={"stage": "analyzing", "claims_count": len(new_claims)})
@@ -351,11 +444,27 @@ async def _execute_analysis_stage(state: ResearchState, notify_progress: Optiona
             return {"success": False, "error": result.get("error")}
             
     except Exception as e:
-        logger.error(f"Analysis stage failed: {e}")
+        logger.error(f"Reading/analysis stage failed: {e}")
         return {"success": False, "error": str(e)}
+    finally:
+        # Closing the reader cancels any fetches it still has in flight
+        if batches is not None:
+            await batches.aclose()
+        # On any early exit (reader error, stage timeout, cancellation) stop
+        # analyst calls still in flight and retrieve their outcomes so none
+        # keep running detached or log "exception was never retrieved"
+        pending = [task for task in analysis_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if analysis_tasks:
+            await asyncio.gather(*analysis_tasks, return_exceptions=True)
 
 
-async def _execute_verification_stage(state: ResearchState, notify_progress: Optional[Callable] = None) -> Dict[str, Any]:
+async def _execute_verification_stage(
+    state: ResearchState,
+    notify_progress: Optional[Callable] = None,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """Execute verification stage."""
     try:
         state["status"] = "verifying"
@@ -368,7 +477,8 @@ async def _execute_verification_stage(state: ResearchState, notify_progress: Opt
             state["claims"],
             state["citations"],
             state["documents"],
-            state["constraints"]
+            state["constraints"],
+            http_client=http_client
         )
         
         if result["success"]:
@@ -392,7 +502,11 @@ async def _execute_verification_stage(state: ResearchState, notify_progress: Opt
         return {"success": False, "error": str(e)}
 
 
-async def _execute_writing_stage(state: ResearchState, notify_progress: Optional[Callable] = None) -> Dict[str, Any]:
+async def _execute_writing_stage(
+    state: ResearchState,
+    notify_progress: Optional[Callable] = None,
+    llm_client: Optional[LLMClient] = None
+) -> Dict[str, Any]:
     """Execute writing stage."""
     try:
         state["status"] = "writing"
@@ -410,7 +524,9 @@ async def _execute_writing_stage(state: ResearchState, notify_progress: Optional
             state["draft_sections"],
             state["topic"],
             state["sub_questions"],
-            coverage_report
+            coverage_report,
+            model_key=state.get("selected_model"),
+            client=llm_client
         )
         
         if result["success"]:
@@ -1,8 +1,9 @@
 """Planner component for transforming topics into search queries."""
 
+import re
 import uuid
-from typing import Dict, List, Any
-from ..providers.openrouter_client import LLMClient
+from typing import Dict, List, Any, Optional
+from ..providers.openrouter_client import LLMClient, use_client
 from ..storage.models import Constraints
 from ..config import Config
 from ..observability.logging import get_logger
@@ -10,6 +11,8 @@ from ..observability.tracing import TimedOperation, emit_event
 
 logger = get_logger(__name__)
 
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
 PLANNING_SYSTEM_PROMPT = """You are a research planning expert. Your task is to break down research topics into focused sub-questions and generate diverse search queries that will help find credible, authoritative sources.
 
@@ -36,7 +39,9 @@ DO NOT include any text before or after the JSON. ONLY return the JSON object.""
 
 async def plan(
     topic: str,
-    constraints: Constraints
+    constraints: Constraints,
+    model_key: Optional[str] = None,
+    client: Optional[LLMClient] = None
 ) -> Dict[str, Any]:
     """
     Generate sub-questions and search queries for a research topic.
@@ -44,6 +49,9 @@ async def plan(
     Args:
         topic: Research topic to plan for
         constraints: Research constraints including domain filters
+        model_key: Model to plan with; defaults to the globally selected model
+        client: Shared LLM client to plan with; one is created (and closed)
+            for this call if not given
     
     Returns:
         Dictionary with success status, sub-questions, and queries
@@ -74,10 +82,7 @@ async def plan(
             user_prompt += "\nGenerate sub-questions and diverse search queries for comprehensive research."
             
             # Get selected model
-            selected_model = Config.SELECTED_MODEL
-            
-            # Initialize LLM client with selected model
-            client = LLMClient(model_key=selected_model)
+            selected_model = model_key or Config.SELECTED_MODEL
             
             # Call LLM for planning
             messages = [
@@ -85,12 +90,15 @@ async def plan(
                 {"role": "user", "content": user_prompt}
             ]
             
-            response = await client.chat(
-                messages=messages,
-                temperature=0.3,
-                max_tokens=1000
-                # Note: Removed response_format as it doesn't work with all models
-            )
+            async with use_client(client, selected_model) as llm_client:
+                response = await llm_client.chat(
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=1000,
+                    # Same topic and constraints, same plan: reuse it across eval runs
+                    cacheable=True
+                    # Note: Removed response_format as it doesn't work with all models
+                )
             
             if not response["success"]:
                 logger.error(f"LLM call failed: {response.get('error')}")
@@ -113,8 +121,7 @@ async def plan(
                     planning_result = json.loads(content)
                 except json.JSONDecodeError:
                     # Fallback: Extract JSON from text using regex
-                    import re
-                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
+                    json_match = _JSON_OBJECT_RE.search(content)
                     if json_match:
                         planning_result = json.loads(json_match.group(0))
                     else:
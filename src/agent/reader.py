@@ -1,16 +1,38 @@
 """Reader component for fetching URLs and processing content into documents and chunks."""
 
 import asyncio
-from typing import Dict, List, Any, Optional
+import itertools
+import re
+from collections import defaultdict
+from typing import AsyncGenerator, Dict, List, Any, Optional
+from urllib.parse import urlparse, urlsplit
+import httpx
 from ..tools.fetch_url import run as fetch_url_run
 from ..tools.parse_pdf import run as parse_pdf_run
 from ..tools.content_quality import validate_content, get_content_summary
+from ..tools.url_utils import extract_domain
 from ..storage.models import SearchResult, Document, Chunk, Constraints, ResearchState, create_chunks_from_document
+from ..storage.cache import LFUCache
 from ..observability.logging import get_logger
 from ..observability.tracing import TimedOperation, emit_event
 
 logger = get_logger(__name__)
 
+# A '.'-delimited segment with some non-whitespace in it, i.e. one sentence
+_SENTENCE_RE = re.compile(r"[^.]*[^.\s][^.]*")
+
+# Common English words for basic language detection
+_ENGLISH_WORDS = frozenset({
+    "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
+    "a", "an", "is", "are", "was", "were", "be", "been", "have", "has", "had"
+})
+
+# Academic/research indicators looked for in document text
+_ACADEMIC_INDICATORS = (
+    "abstract", "introduction", "methodology", "results", "conclusion",
+    "references", "doi:", "arxiv:", "journal", "university", "research"
+)
+
 
 async def read(
     search_results: List[SearchResult],
@@ -57,55 +79,23 @@ async def read(
             partial_failures = []
             
             for i, fetch_result in enumerate(fetch_results):
-                try:
-                    search_result = search_results[i]
-                    url = urls[i]
-                    
-                    if not fetch_result["success"]:
-                        error_msg = fetch_result.get('error', 'Unknown fetch error')
-                        logger.warning(f"Failed to fetch {url}: {error_msg}")
-                        failed_fetches += 1
-                        # Record as partial failure
-                        partial_failures.append({
-                            "source": url,
-                            "error": f"Fetch failed: {error_msg}"
-                        })
-                        continue
-                    
-                    # Create document from fetch result (includes quality gate)
-                    document_result = _create_document_from_fetch_result_with_quality_gate(
-                        fetch_result, search_result
-                    )
-                    
-                    if not document_result["success"]:
-                        failed_fetches += 1
-                        # Record quality gate or other failures
-                        partial_failures.append({
-                            "source": url,
-                            "error": document_result["error"]
-                        })
-                        if "quality gate" in document_result["error"].lower():
-                            quality_gate_failures += 1
-                        continue
-                    
-                    document = document_result["document"]
-                    documents.append(document)
-                    successful_fetches += 1
-                    
-                    # Create chunks from document
-                    doc_chunks = create_chunks_from_document(document, max_tokens_per_chunk)
-                    chunks.extend(doc_chunks)
-                    
-                    logger.debug(f"Processed {url}: {len(doc_chunks)} chunks")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing result for {urls[i]}: {e}")
+                processed = _process_fetch_result(
+                    fetch_result, search_results[i], urls[i], max_tokens_per_chunk
+                )
+                
+                if not processed["success"]:
                     failed_fetches += 1
                     partial_failures.append({
                         "source": urls[i],
-                        "error": f"Processing error: {str(e)}"
+                        "error": processed["error"]
                     })
+                    if processed.get("quality_gate_failure"):
+                        quality_gate_failures += 1
                     continue
+                
+                documents.append(processed["document"])
+                chunks.extend(processed["chunks"])
+                successful_fetches += 1
             
             # Calculate metrics
             total_text_length = sum(len(doc["text"]) for doc in documents)
@@ -113,14 +103,7 @@ async def read(
             avg_chunk_size = total_text_length / total_chunks if total_chunks > 0 else 0
             
             # Extract domain diversity
-            domains = set()
-            for doc in documents:
-                try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(doc["url"]).netloc
-                    domains.add(domain)
-                except Exception:
-                    continue
+            domains = {extract_domain(doc["url"]) for doc in documents}
             
             metadata = {
                 "urls_requested": len(urls),
@@ -180,6 +163,202 @@ async def read(
             }
 
 
+async def read_batches(
+    search_results: List[SearchResult],
+    constraints: Constraints,
+    state: Optional[ResearchState] = None,
+    batch_size: int = 5,
+    cache: Optional[LFUCache] = None,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Fetch URLs and yield documents and chunks in batches as fetches complete.
+    
+    Unlike read(), which returns only after every URL has been fetched, this
+    lets downstream stages (the analyst) start on the first documents while
+    the remaining fetches are still in flight.
+    
+    Args:
+        search_results: List of search results to fetch and process
+        constraints: Research constraints including timeouts
+        state: Research state to update with partial failures
+        batch_size: Number of successfully processed documents per batch
+        cache: Optional cache of successful fetch results shared across runs
+        http_client: Optional shared HTTP client used for every fetch
+    
+    Yields:
+        Dictionaries with success status, documents, chunks, and batch metadata
+    """
+    if not search_results:
+        yield {
+            "success": False,
+            "error": "No search results provided",
+            "documents": [],
+            "chunks": []
+        }
+        return
+    
+    urls = [result["url"] for result in search_results]
+    logger.info(f"Reading {len(urls)} URLs in batches of {batch_size}")
+    
+    fetch_timeout = constraints.get("fetch_timeout_s", 15.0)
+    max_tokens_per_chunk = constraints.get("max_tokens_per_chunk", 1000)
+    semaphore = asyncio.Semaphore(5)
+    
+    async def fetch_indexed(index: int) -> tuple:
+        cache_key = _fetch_cache_key(urls[index])
+        if cache is not None:
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                return index, cached_result
+        
+        async with semaphore:
+            try:
+                fetch_result = await fetch_url_run(
+                    urls[index], timeout=fetch_timeout, client=http_client
+                )
+                if cache is not None and fetch_result.get("success"):
+                    cache.set(cache_key, fetch_result)
+                return index, fetch_result
+            except Exception as e:
+                return index, {
+                    "success": False,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "url": urls[index]
+                }
+    
+    documents: List[Document] = []
+    chunks: List[Chunk] = []
+    failures: List[Dict[str, str]] = []
+    failed_fetches = 0
+    quality_gate_failures = 0
+    # Run-wide totals for the reading_completed event
+    totals = {"documents": 0, "chunks": 0, "failed": 0, "quality_gate": 0, "text_length": 0}
+    domains = set()
+    
+    def _flush() -> Dict[str, Any]:
+        batch = {
+            "success": True,
+            "documents": list(documents),
+            "chunks": list(chunks),
+            "partial_failures": list(failures),
+            "metadata": {
+                "successful_fetches": len(documents),
+                "failed_fetches": failed_fetches,
+                "quality_gate_failures": quality_gate_failures
+            }
+        }
+        if state is not None and failures:
+            state["partial_failures"].extend(failures)
+        return batch
+    
+    with TimedOperation("agent_reader"):
+        # Owned here so that when the consumer stops early (stage budget,
+        # analyst failure) no fetch keeps hitting the network afterwards
+        fetch_tasks = [asyncio.create_task(fetch_indexed(i)) for i in range(len(urls))]
+        try:
+            for next_result in asyncio.as_completed(fetch_tasks):
+                index, fetch_result = await next_result
+                processed = _process_fetch_result(
+                    fetch_result, search_results[index], urls[index], max_tokens_per_chunk
+                )
+                
+                if processed["success"]:
+                    document = processed["document"]
+                    documents.append(document)
+                    chunks.extend(processed["chunks"])
+                    totals["documents"] += 1
+                    totals["chunks"] += len(processed["chunks"])
+                    totals["text_length"] += len(document["text"])
+                    domains.add(extract_domain(document["url"]))
+                else:
+                    failed_fetches += 1
+                    totals["failed"] += 1
+                    failures.append({"source": urls[index], "error": processed["error"]})
+                    if processed.get("quality_gate_failure"):
+                        quality_gate_failures += 1
+                        totals["quality_gate"] += 1
+                
+                if len(documents) >= batch_size:
+                    yield _flush()
+                    documents, chunks, failures = [], [], []
+                    failed_fetches = quality_gate_failures = 0
+            
+            if documents or failures:
+                yield _flush()
+        finally:
+            for task in fetch_tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*fetch_tasks, return_exceptions=True)
+        
+        metadata = {
+            "urls_requested": len(urls),
+            "successful_fetches": totals["documents"],
+            "failed_fetches": totals["failed"],
+            "quality_gate_failures": totals["quality_gate"],
+            "documents_created": totals["documents"],
+            "chunks_created": totals["chunks"],
+            "total_text_length": totals["text_length"],
+            "avg_chunk_size": int(totals["text_length"] / totals["chunks"]) if totals["chunks"] else 0,
+            "domain_diversity": len(domains),
+            "fetch_timeout": fetch_timeout,
+            "partial_failures_count": totals["failed"]
+        }
+        logger.info(
+            f"Reading completed: {totals['documents']}/{len(urls)} URLs, "
+            f"{totals['chunks']} chunks, {totals['quality_gate']} quality gate failures",
+            extra=metadata
+        )
+        emit_event("reading_completed", metadata=metadata)
+
+
+def _fetch_cache_key(url: str) -> str:
+    """Normalize a URL for fetch caching (case-insensitive host, no fragment)."""
+    parts = urlsplit(url.strip())
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path or '/'}" + (
+        f"?{parts.query}" if parts.query else ""
+    )
+
+
+def _process_fetch_result(
+    fetch_result: Dict[str, Any],
+    search_result: SearchResult,
+    url: str,
+    max_tokens_per_chunk: int
+) -> Dict[str, Any]:
+    """Turn a single fetch result into a document and its chunks."""
+    try:
+        if not fetch_result["success"]:
+            error_msg = fetch_result.get('error', 'Unknown fetch error')
+            logger.warning(f"Failed to fetch {url}: {error_msg}")
+            return {"success": False, "error": f"Fetch failed: {error_msg}"}
+        
+        # Create document from fetch result (includes quality gate)
+        document_result = _create_document_from_fetch_result_with_quality_gate(
+            fetch_result, search_result
+        )
+        
+        if not document_result["success"]:
+            return {
+                "success": False,
+                "error": document_result["error"],
+                "quality_gate_failure": "quality gate" in document_result["error"].lower()
+            }
+        
+        document = document_result["document"]
+        doc_chunks = create_chunks_from_document(document, max_tokens_per_chunk)
+        
+        logger.debug(f"Processed {url}: {len(doc_chunks)} chunks")
+        
+        return {"success": True, "document": document, "chunks": doc_chunks}
+        
+    except Exception as e:
+        logger.error(f"Error processing result for {url}: {e}")
+        return {"success": False, "error": f"Processing error: {str(e)}"}
+
+
 async def _fetch_urls_concurrent(urls: List[str], timeout: float, max_concurrent: int = 5) -> List[Dict[str, Any]]:
     """Fetch URLs concurrently with controlled concurrency."""
     semaphore = asyncio.Semaphore(max_concurrent)
@@ -247,7 +426,7 @@ def _create_document_from_fetch_result_with_quality_gate(
         quality_validation = validate_content(text)
         if not quality_validation["ok"]:
             reason = quality_validation["reason"]
-            metrics_summary = get_content_summary(text)
+            metrics_summary = get_content_summary(text, quality_validation)
             logger.warning(f"Content Quality Gate failed for {url}: {reason} ({metrics_summary})")
             return {
                 "success": False,
@@ -257,11 +436,10 @@ def _create_document_from_fetch_result_with_quality_gate(
         
         # Extract domain for metadata
         try:
-            from urllib.parse import urlparse
             parsed_url = urlparse(url)
             domain = parsed_url.netloc
             path = parsed_url.path
-        except Exception:
+        except ValueError:
             domain = "unknown"
             path = ""
         
@@ -296,22 +474,14 @@ def _create_document_from_fetch_result_with_quality_gate(
         }
 
 
-def _detect_content_language(text: str) -> str:
-    """Simple language detection based on common words."""
-    if not text:
-        return "unknown"
-    
+def _detect_content_language(words: List[str]) -> str:
+    """Simple language detection based on common words in lowercased tokens."""
     # Very basic detection - count common English words
-    english_words = {
-        "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
-        "a", "an", "is", "are", "was", "were", "be", "been", "have", "has", "had"
-    }
-    
-    words = text.lower().split()[:100]  # Check first 100 words
+    words = words[:100]  # Check first 100 words
     if not words:
         return "unknown"
     
-    english_count = sum(1 for word in words if word in english_words)
+    english_count = sum(1 for word in words if word in _ENGLISH_WORDS)
     english_ratio = english_count / len(words)
     
     return "en" if english_ratio > 0.3 else "unknown"
@@ -319,21 +489,18 @@ def _detect_content_language(text: str) -> str:
 
 def _extract_basic_metadata(text: str, url: str) -> Dict[str, Any]:
     """Extract basic metadata from text content."""
+    # Lowercase and tokenize once; word count, language and indicators share it
+    text_lower = text.lower()
+    words = text_lower.split()
     metadata = {
         "char_count": len(text),
-        "word_count": len(text.split()),
-        "paragraph_count": len([p for p in text.split('\n\n') if p.strip()]),
-        "language": _detect_content_language(text)
+        "word_count": len(words),
+        "paragraph_count": sum(1 for p in text.split('\n\n') if p.strip()),
+        "language": _detect_content_language(words)
     }
     
     # Check for academic/research indicators
-    academic_indicators = [
-        "abstract", "introduction", "methodology", "results", "conclusion",
-        "references", "doi:", "arxiv:", "journal", "university", "research"
-    ]
-    
-    text_lower = text.lower()
-    academic_score = sum(1 for indicator in academic_indicators if indicator in text_lower)
+    academic_score = sum(1 for indicator in _ACADEMIC_INDICATORS if indicator in text_lower)
     metadata["academic_score"] = academic_score
     metadata["likely_academic"] = academic_score >= 3
     
@@ -364,9 +531,9 @@ def _passes_content_quality_check(text: str) -> bool:
     if not text or len(text.strip()) < 50:
         return False
     
-    # Check for reasonable sentence structure
-    sentences = [s.strip() for s in text.split('.') if s.strip()]
-    if len(sentences) < 3:
+    # Check for reasonable sentence structure; stops scanning at the third sentence
+    sentences = itertools.islice(_SENTENCE_RE.finditer(text), 3)
+    if sum(1 for _ in sentences) < 3:
         return False
     
     # Check for excessive repetition (spam indicator)
@@ -379,12 +546,9 @@ def _passes_content_quality_check(text: str) -> bool:
 
 def group_chunks_by_document(chunks: List[Chunk]) -> Dict[str, List[Chunk]]:
     """Group chunks by their source document URL."""
-    grouped = {}
+    grouped = defaultdict(list)
     
     for chunk in chunks:
-        doc_url = chunk["doc_url"]
-        if doc_url not in grouped:
-            grouped[doc_url] = []
-        grouped[doc_url].append(chunk)
+        grouped[chunk["doc_url"]].append(chunk)
     
-    return grouped
\ No newline at end of file
+    return dict(grouped)
\ No newline at end of file
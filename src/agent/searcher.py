@@ -1,19 +1,32 @@
 """Searcher component for executing web searches and collecting results."""
 
-from typing import Dict, List, Any
+from collections import defaultdict
+from typing import Dict, List, Any, Optional
 from ..tools.web_search import run as web_search_run
+from ..tools.url_utils import extract_domain
 from ..storage.models import SearchResult, Constraints
+from ..storage.cache import LFUCache
 from ..observability.logging import get_logger
 from ..observability.tracing import TimedOperation, emit_event
 
 logger = get_logger(__name__)
 
+# Fields every search result must carry as strings
+_SEARCH_RESULT_FIELDS = ("title", "url", "snippet")
+
+# Phrases typical of spam results; two or more in a title/snippet filters it out
+_SPAM_PATTERNS = (
+    "click here", "buy now", "free download", "limited time",
+    "act now", "special offer", "$$$", "make money"
+)
+
 
 async def search(
     queries: List[str],
     constraints: Constraints,
     provider: str = "duckduckgo",
-    max_results_per_query: int = 10
+    max_results_per_query: int = 10,
+    cache: Optional[LFUCache] = None
 ) -> Dict[str, Any]:
     """
     Execute search queries using the configured search provider.
@@ -23,6 +36,7 @@ async def search(
         constraints: Research constraints including domain filters
         provider: Search provider to use (default: duckduckgo)
         max_results_per_query: Maximum results per individual query
+        cache: Optional per-query result cache shared across pipeline runs
     
     Returns:
         Dictionary with success status, search results, and metadata
@@ -58,7 +72,8 @@ async def search(
                 max_results_per_query=max_results_per_query,
                 include_domains=include_domains if include_domains else None,
                 exclude_domains=exclude_domains if exclude_domains else None,
-                per_domain_cap=per_domain_cap
+                per_domain_cap=per_domain_cap,
+                cache=cache
             )
             
             if not search_result["success"]:
@@ -94,14 +109,7 @@ async def search(
             search_results = _post_process_results(search_results, constraints)
             
             # Calculate metrics
-            domains = set()
-            for result in search_results:
-                try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(result["url"]).netloc
-                    domains.add(domain)
-                except Exception:
-                    continue
+            domains = {extract_domain(result["url"]) for result in search_results}
             
             metrics = {
                 "total_queries": len(queries),
@@ -148,10 +156,8 @@ async def search(
 
 def _validate_search_result(result: Dict[str, Any]) -> bool:
     """Validate a search result dictionary."""
-    required_fields = {"title", "url", "snippet"}
-    
     # Check required fields exist and are strings
-    if not all(field in result and isinstance(result[field], str) for field in required_fields):
+    if not all(isinstance(result.get(field), str) for field in _SEARCH_RESULT_FIELDS):
         return False
     
     # Check URL format
@@ -197,13 +203,8 @@ def _passes_quality_filters(result: Dict[str, Any], constraints: Constraints) ->
     snippet = result["snippet"].lower()
     
     # Simple spam detection
-    spam_patterns = [
-        "click here", "buy now", "free download", "limited time",
-        "act now", "special offer", "$$$", "make money"
-    ]
-    
     text_to_check = f"{title} {snippet}"
-    spam_score = sum(1 for pattern in spam_patterns if pattern in text_to_check)
+    spam_score = sum(1 for pattern in _SPAM_PATTERNS if pattern in text_to_check)
     
     if spam_score >= 2:
         logger.debug(f"Filtered spam result: {result['title']}")
@@ -219,18 +220,10 @@ def _passes_quality_filters(result: Dict[str, Any], constraints: Constraints) ->
 # Utility functions for search result processing
 def extract_domains_from_results(results: List[Dict[str, Any]]) -> List[str]:
     """Extract unique domains from search results."""
-    domains = set()
-    
-    for result in results:
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(result["url"]).netloc
-            if domain:
-                domains.add(domain)
-        except Exception:
-            continue
+    domains = {extract_domain(result["url"]) for result in results}
+    domains.discard("")
     
-    return sorted(list(domains))
+    return sorted(domains)
 
 
 def filter_results_by_domain(
@@ -245,29 +238,17 @@ def filter_results_by_domain(
     allowed_set = set(allowed_domains)
     
     for result in results:
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(result["url"]).netloc
-            if domain in allowed_set:
-                filtered_results.append(result)
-        except Exception:
-            continue
+        if extract_domain(result["url"]) in allowed_set:
+            filtered_results.append(result)
     
     return filtered_results
 
 
 def group_results_by_domain(results: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     """Group search results by domain."""
-    grouped = {}
+    grouped = defaultdict(list)
     
     for result in results:
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(result["url"]).netloc
-            if domain not in grouped:
-                grouped[domain] = []
-            grouped[domain].append(result)
-        except Exception:
-            continue
+        grouped[extract_domain(result["url"])].append(result)
     
-    return grouped
\ No newline at end of file
+    return dict(grouped)
\ No newline at end of file
@@ -1,22 +1,45 @@
 """Verifier component for citation validation and coverage enforcement."""
 
 import asyncio
+from collections import Counter
 from typing import Dict, List, Any, Set, Optional
-from urllib.parse import urlparse
 import httpx
 from ..storage.models import Claim, Citation, Document, Constraints
+from ..tools.url_utils import extract_domain
 from ..observability.logging import get_logger
 from ..observability.tracing import TimedOperation, emit_event
 
 logger = get_logger(__name__)
 
+# Obvious/common knowledge patterns that don't need citation
+_OBVIOUS_PATTERNS = (
+    "is a", "are known as", "commonly", "generally", 
+    "typically", "usually", "widely", "broadly"
+)
+
+# Claims that definitely need citation
+_NEEDS_CITATION_PATTERNS = (
+    "research shows", "study found", "according to", "data indicates",
+    "statistics show", "report states", "analysis reveals", "survey",
+    "%", "percent", "million", "billion", "increase", "decrease",
+    "compared to", "versus", "growth", "decline"
+)
+
+# Common words skipped when extracting follow-up search terms
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", 
+    "of", "with", "by", "is", "are", "was", "were", "be", "been", "have", 
+    "has", "had", "that", "this", "these", "those", "will", "would", "could"
+})
+
 
 async def verify(
     claims: List[Claim],
     citations: List[Citation],
     documents: List[Document],
     constraints: Constraints,
-    target_sources_per_claim: int = 1
+    target_sources_per_claim: int = 1,
+    http_client: Optional[httpx.AsyncClient] = None
 ) -> Dict[str, Any]:
     """
     Verify claim coverage and citation quality.
@@ -27,6 +50,7 @@ async def verify(
         documents: List of available documents
         constraints: Research constraints
         target_sources_per_claim: Minimum sources required per claim
+        http_client: Optional shared HTTP client for citation URL checks
     
     Returns:
         Dictionary with verification results and follow-up recommendations
@@ -52,26 +76,37 @@ async def verify(
             citation_map = {cit["claim_id"]: cit for cit in citations}
             available_urls = {doc["url"] for doc in documents}
             
-            # Verify each claim
-            verification_results = []
-            
-            for claim in claims:
-                result = await _verify_single_claim(
-                    claim, 
-                    citation_map.get(claim["id"]), 
-                    available_urls,
-                    target_sources_per_claim
+            # URL checks are network-bound and independent of claim
+            # verification, so start them first and let them overlap
+            url_check_task = asyncio.create_task(
+                _check_citation_urls(
+                    citations, documents, client=http_client, document_urls=available_urls
                 )
-                verification_results.append(result)
+            )
             
-            # Identify unsupported claims
-            unsupported_claims = [
-                result["claim"] for result in verification_results 
-                if not result["is_supported"]
-            ]
+            # Verify each claim, sorting out the unsupported ones in the same pass
+            verification_results = []
+            unsupported_claims = []
             
-            # Check URL accessibility for citations
-            url_check_results = await _check_citation_urls(citations, documents)
+            try:
+                for claim in claims:
+                    result = await _verify_single_claim(
+                        claim, 
+                        citation_map.get(claim["id"]), 
+                        available_urls,
+                        target_sources_per_claim
+                    )
+                    verification_results.append(result)
+                    if not result["is_supported"]:
+                        unsupported_claims.append(result["claim"])
+                
+                # Check URL accessibility for citations
+                url_check_results = await url_check_task
+            finally:
+                # A failed or cancelled claim check must not leave the URL checks running
+                if not url_check_task.done():
+                    url_check_task.cancel()
+                    await asyncio.gather(url_check_task, return_exceptions=True)
             
             # Update citations based on URL checks
             updated_citations = _update_citations_with_url_checks(
@@ -86,7 +121,7 @@ async def verify(
             )
             
             # Calculate coverage metrics
-            supported_count = len([r for r in verification_results if r["is_supported"]])
+            supported_count = len(verification_results) - len(unsupported_claims)
             coverage_percentage = (supported_count / len(claims)) * 100 if claims else 100.0
             
             # Analyze domain diversity
@@ -205,13 +240,7 @@ async def _verify_single_claim(
     
     # Check for domain diversity
     if len(available_citation_urls) > 1:
-        domains = set()
-        for url in available_citation_urls:
-            try:
-                domain = urlparse(url).netloc
-                domains.add(domain)
-            except Exception:
-                continue
+        domains = {extract_domain(url) for url in available_citation_urls}
         
         if len(domains) < len(available_citation_urls):
             issues.append("Multiple sources from same domain - limited diversity")
@@ -239,32 +268,18 @@ def _claim_needs_citation(claim: Claim) -> bool:
     """Determine if a claim needs citation support."""
     claim_text = claim["text"].lower()
     
-    # Obvious/common knowledge patterns that don't need citation
-    obvious_patterns = [
-        "is a", "are known as", "commonly", "generally", 
-        "typically", "usually", "widely", "broadly"
-    ]
-    
-    # Claims that definitely need citation
-    needs_citation_patterns = [
-        "research shows", "study found", "according to", "data indicates",
-        "statistics show", "report states", "analysis reveals", "survey",
-        "%", "percent", "million", "billion", "increase", "decrease",
-        "compared to", "versus", "growth", "decline"
-    ]
-    
     # Check if claim has specific numbers or research references
-    has_specifics = any(pattern in claim_text for pattern in needs_citation_patterns)
+    has_specifics = any(pattern in claim_text for pattern in _NEEDS_CITATION_PATTERNS)
     
     # Check if claim appears to be obvious
-    appears_obvious = any(pattern in claim_text for pattern in obvious_patterns)
+    appears_obvious = any(pattern in claim_text for pattern in _OBVIOUS_PATTERNS)
     
     # Opinion claims with high confidence need support
     if claim["type"] == "opinion" and claim["confidence"] > 0.7:
         return True
     
     # Fact and estimate claims generally need citation
-    if claim["type"] in ["fact", "estimate"]:
+    if claim["type"] in ("fact", "estimate"):
         return not appears_obvious or has_specifics
     
     # Default: if it has specific data, it needs citation
@@ -274,9 +289,16 @@ def _claim_needs_citation(claim: Claim) -> bool:
 async def _check_citation_urls(
     citations: List[Citation], 
     documents: List[Document],
-    timeout: float = 5.0
+    timeout: float = 5.0,
+    client: Optional[httpx.AsyncClient] = None,
+    concurrency: int = 10,
+    document_urls: Optional[Set[str]] = None
 ) -> Dict[str, Dict[str, Any]]:
-    """Check URL accessibility for citation validation."""
+    """
+    Check URL accessibility for citation validation.
+    
+    document_urls is the set of document URLs if the caller already built it.
+    """
     
     # Collect all unique URLs from citations
     all_urls = set()
@@ -284,9 +306,11 @@ async def _check_citation_urls(
         all_urls.update(citation["urls"])
     
     # Quick check: if URL is in our documents, consider it accessible
-    document_urls = {doc["url"] for doc in documents}
+    if document_urls is None:
+        document_urls = {doc["url"] for doc in documents}
     
     url_results = {}
+    remote_urls = []
     
     # Check each URL
     for url in all_urls:
@@ -299,24 +323,39 @@ async def _check_citation_urls(
                 "error": None
             }
         else:
-            # Check URL accessibility with a quick HEAD request
-            result = await _check_single_url(url, timeout)
-            url_results[url] = result
+            remote_urls.append(url)
+    
+    # Check the remaining URLs with quick HEAD requests, a bounded number at a time
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def _check(url: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await _check_single_url(url, timeout, client)
+    
+    results = await asyncio.gather(*[_check(url) for url in remote_urls])
+    url_results.update(zip(remote_urls, results))
     
     return url_results
 
 
-async def _check_single_url(url: str, timeout: float) -> Dict[str, Any]:
+async def _check_single_url(
+    url: str,
+    timeout: float,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """Check if a single URL is accessible."""
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.head(url, follow_redirects=True)
-            return {
-                "accessible": response.status_code < 400,
-                "status_code": response.status_code,
-                "method": "http_head",
-                "error": None
-            }
+        if client is not None:
+            response = await client.head(url, follow_redirects=True, timeout=timeout)
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as own_client:
+                response = await own_client.head(url, follow_redirects=True)
+        return {
+            "accessible": response.status_code < 400,
+            "status_code": response.status_code,
+            "method": "http_head",
+            "error": None
+        }
     except httpx.TimeoutException:
         return {
             "accessible": False,
@@ -405,14 +444,8 @@ def _generate_follow_up_queries(
 def _extract_key_terms(text: str) -> str:
     """Extract key terms from claim text for search queries."""
     # Simple extraction of important words (skip common words)
-    stop_words = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", 
-        "of", "with", "by", "is", "are", "was", "were", "be", "been", "have", 
-        "has", "had", "that", "this", "these", "those", "will", "would", "could"
-    }
-    
     words = text.lower().split()
-    key_words = [word for word in words if word not in stop_words and len(word) > 3]
+    key_words = [word for word in words if word not in _STOP_WORDS and len(word) > 3]
     
     return " ".join(key_words[:4])  # Return top 4 key terms
 
@@ -423,31 +456,23 @@ def _analyze_domain_diversity(
 ) -> Dict[str, Any]:
     """Analyze domain diversity in citations."""
     
-    all_domains = set()
-    domain_counts = {}
-    
-    for citation in citations:
-        for url in citation["urls"]:
-            try:
-                domain = urlparse(url).netloc
-                all_domains.add(domain)
-                domain_counts[domain] = domain_counts.get(domain, 0) + 1
-            except Exception:
-                continue
+    domain_counts = Counter(
+        extract_domain(url) for citation in citations for url in citation["urls"]
+    )
+    total_citations = sum(domain_counts.values())
     
     # Calculate diversity metrics
-    total_citations = sum(domain_counts.values())
-    unique_domains = len(all_domains)
+    unique_domains = len(domain_counts)
     
     # Find most cited domains
-    top_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    top_domains = domain_counts.most_common(5)
     
     return {
         "unique_domains": unique_domains,
         "total_citations": total_citations,
         "diversity_ratio": unique_domains / total_citations if total_citations > 0 else 0,
         "top_domains": top_domains,
-        "domain_distribution": domain_counts
+        "domain_distribution": dict(domain_counts)
     }
 
 
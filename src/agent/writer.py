@@ -1,15 +1,32 @@
 """Writer component for generating final research reports with citations."""
 
 import json
+import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from ..providers.openrouter_client import chat, create_json_schema_format
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from ..providers.openrouter_client import LLMClient, chat, create_json_schema_format, use_client
 from ..storage.models import Claim, Citation, Reference, Report
 from ..observability.logging import get_logger
 from ..observability.tracing import TimedOperation, emit_event
 
 logger = get_logger(__name__)
 
+# Fallback patterns for pulling the report JSON out of a non-JSON response, tried in order
+_JSON_PATTERNS = [
+    re.compile(r'\{.*\}', re.DOTALL),  # Original pattern
+    re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL),  # JSON in code blocks
+    re.compile(r'```\s*(\{.*?\})\s*```', re.DOTALL),  # Generic code blocks
+    re.compile(r'(\{[^{}]*"report_markdown"[^{}]*\})', re.DOTALL)  # Target specific JSON
+]
+_CITATION_RE = re.compile(r'\[\d+\]')
+
 
 WRITING_SYSTEM_PROMPT = """You are an expert research writer who creates comprehensive, well-structured reports. Your task is to:
 
@@ -45,7 +62,9 @@ async def write(
     draft_sections: List[str],
     topic: str,
     sub_questions: List[str],
-    coverage_report: Optional[Dict[str, Any]] = None
+    coverage_report: Optional[Dict[str, Any]] = None,
+    model_key: Optional[str] = None,
+    client: Optional[LLMClient] = None
 ) -> Dict[str, Any]:
     """
     Generate final research report with citations and references.
@@ -57,6 +76,9 @@ async def write(
         topic: Main research topic
         sub_questions: Research questions addressed
         coverage_report: Verification coverage metrics
+        model_key: Model to write with; defaults to the globally selected model
+        client: Shared LLM client to write with; one is created (and closed)
+            for this call if not given
     
     Returns:
         Dictionary with success status, report, and metadata
@@ -80,13 +102,15 @@ async def write(
             citation_map, references = _create_citation_mapping(citations)
             
             # Generate report content using LLM
-            report_content = await _generate_report_content(
-                topic,
-                sub_questions,
-                organized_claims,
-                citation_map,
-                draft_sections
-            )
+            async with use_client(client, model_key) as llm_client:
+                report_content = await _generate_report_content(
+                    topic,
+                    sub_questions,
+                    organized_claims,
+                    citation_map,
+                    draft_sections,
+                    client=llm_client
+                )
             
             if not report_content["success"]:
                 logger.error(f"Report generation failed: {report_content.get('error')}")
@@ -175,7 +199,8 @@ async def _generate_report_content(
     sub_questions: List[str],
     organized_claims: Dict[str, List[Claim]],
     citation_map: Dict[str, int],
-    draft_sections: List[str]
+    draft_sections: List[str],
+    client: Optional[LLMClient] = None
 ) -> Dict[str, Any]:
     """Generate report content using LLM with structured output."""
     
@@ -235,7 +260,8 @@ Target: 800-1200 words."""
         response = await chat(
             messages=messages,
             temperature=0.2,
-            max_tokens=3000
+            max_tokens=3000,
+            client=client
             # Note: Removed response_format as it doesn't work with gpt-oss-120b
         )
         
@@ -269,7 +295,7 @@ Target: 800-1200 words."""
                 # Try one more retry with a simpler prompt
                 logger.info("Attempting retry with simplified prompt")
                 return await _retry_with_simple_prompt(
-                    topic, sub_questions, organized_claims, citation_map
+                    topic, sub_questions, organized_claims, citation_map, client
                 )
             
             # Enhanced content debugging
@@ -283,24 +309,17 @@ Target: 800-1200 words."""
             except json.JSONDecodeError as json_err:
                 logger.warning(f"Direct JSON parsing failed: {json_err}")
                 # Fallback: Extract JSON from text using regex
-                import re
-                
-                # Try multiple JSON extraction patterns
-                json_patterns = [
-                    r'\{.*\}',  # Original pattern
-                    r'```json\s*(\{.*?\})\s*```',  # JSON in code blocks
-                    r'```\s*(\{.*?\})\s*```',  # Generic code blocks
-                    r'(\{[^{}]*"report_markdown"[^{}]*\})'  # Target specific JSON
-                ]
+                if '{' not in content:
+                    raise ValueError("No valid JSON found in response")
                 
                 result = None
-                for pattern in json_patterns:
-                    json_match = re.search(pattern, content, re.DOTALL)
+                for pattern in _JSON_PATTERNS:
+                    json_match = pattern.search(content)
                     if json_match:
                         try:
                             json_content = json_match.group(1) if len(json_match.groups()) > 0 else json_match.group(0)
                             result = json.loads(json_content)
-                            logger.info(f"JSON extracted successfully with pattern: {pattern}")
+                            logger.info(f"JSON extracted successfully with pattern: {pattern.pattern}")
                             break
                         except json.JSONDecodeError:
                             continue
@@ -350,7 +369,7 @@ Target: 800-1200 words."""
             # Final fallback: try simple prompt
             logger.info("Attempting final retry with basic prompt")
             return await _retry_with_simple_prompt(
-                topic, sub_questions, organized_claims, citation_map
+                topic, sub_questions, organized_claims, citation_map, client
             )
         
     except Exception as e:
@@ -366,7 +385,8 @@ async def _retry_with_simple_prompt(
     topic: str,
     sub_questions: List[str],
     organized_claims: Dict[str, List[Claim]],
-    citation_map: Dict[str, int]
+    citation_map: Dict[str, int],
+    client: Optional[LLMClient] = None
 ) -> Dict[str, Any]:
     """
     Retry report generation with a simplified prompt when structured output fails.
@@ -403,7 +423,8 @@ Please write the complete report now:"""
         response = await chat(
             messages=messages,
             temperature=0.3,
-            max_tokens=3000
+            max_tokens=3000,
+            client=client
         )
         
         if not response["success"]:
@@ -509,6 +530,9 @@ def _create_citation_mapping(citations: List[Citation]) -> tuple[Dict[str, int],
     # Track URLs to avoid duplicates in references
     seen_urls = set()
     
+    # Every reference in a report shares the same access date
+    access_date = datetime.now().strftime("%Y-%m-%d")
+    
     for citation in citations:
         for url in citation["urls"]:
             if url not in seen_urls:
@@ -519,7 +543,7 @@ def _create_citation_mapping(citations: List[Citation]) -> tuple[Dict[str, int],
                     "number": citation_number,
                     "url": url,
                     "title": _extract_title_from_url(url),
-                    "access_date": datetime.now().strftime("%Y-%m-%d")
+                    "access_date": access_date
                 }
                 references.append(reference)
                 
@@ -618,7 +642,6 @@ def _extract_section_headers(report_md: str) -> List[str]:
 def _extract_title_from_url(url: str) -> Optional[str]:
     """Extract a simple title from URL for reference formatting."""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         domain = parsed.netloc
         path = parsed.path
@@ -630,7 +653,7 @@ def _extract_title_from_url(url: str) -> Optional[str]:
                 return ' '.join(word.capitalize() for word in title_parts[:3])
         
         return domain
-    except Exception:
+    except ValueError:
         return None
 
 
@@ -657,10 +680,9 @@ def validate_report_structure(report_md: str) -> Dict[str, Any]:
     validation["has_references"] = "## references" in content_lower or "# references" in content_lower
     
     # Count sections and citations
-    validation["section_count"] = len([line for line in lines if line.strip().startswith('#')])
+    validation["section_count"] = sum(1 for line in lines if line.strip().startswith('#'))
     
-    import re
-    citations = re.findall(r'\[\d+\]', report_md)
+    citations = _CITATION_RE.findall(report_md)
     validation["citation_count"] = len(set(citations))
     validation["has_citations"] = validation["citation_count"] > 0
     
@@ -669,4 +691,8 @@ def validate_report_structure(report_md: str) -> Dict[str, Any]:
 
 def export_report_to_json(report: Report) -> str:
     """Export report to JSON format for API/storage."""
+    if orjson is not None:
+        return orjson.dumps(
+            report, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME, default=str
+        ).decode("utf-8")
     return json.dumps(report, indent=2, default=str)
\ No newline at end of file
@@ -3,7 +3,8 @@
 import os
 import asyncio
 import time
-from typing import Dict, Any, Optional
+from collections import Counter, defaultdict
+from typing import Dict, Any, List, Optional
 import streamlit as st
 from datetime import datetime
 import json
@@ -15,6 +16,7 @@ load_dotenv()
 
 # Import agent components
 from src.agent.orchestrator import run_research_pipeline, validate_pipeline_inputs
+from src.agent.writer import export_report_to_json
 from src.storage.models import create_default_constraints, Constraints
 from src.config import Config
 from src.observability.logging import get_logger
@@ -134,16 +136,19 @@ def _render_hierarchical_model_selection() -> str:
         }
     }
     
+    # Base model of each variant, looked up once rather than per variant;
+    # the first matching base model wins, as in BASE_MODELS order
+    base_model_by_key: Dict[str, str] = {}
+    for base_key in Config.BASE_MODELS:
+        for model_key in Config.get_models_by_base_model(base_key):
+            base_model_by_key.setdefault(model_key, base_key)
+    
     # Populate models by provider
     for model_key, model_config in available_models_dict.items():
         provider = model_config.provider
         if provider in provider_groups:
             # Create display name for model
-            base_model_key = None
-            for base_key, variants in Config.BASE_MODELS.items():
-                if model_key in Config.get_models_by_base_model(base_key):
-                    base_model_key = base_key
-                    break
+            base_model_key = base_model_by_key.get(model_key)
             
             if base_model_key:
                 base_config = Config.BASE_MODELS[base_model_key]
@@ -849,7 +854,7 @@ def _run_research(topic: str, constraints: Constraints, selected_model: str):
     """Execute research pipeline asynchronously with Stage 1.5 progress tracking."""
     st.session_state.research_running = True
     st.session_state.research_logs = []
-    st.session_state.research_start_time = time.time()  # Stage 1.5: Track start time
+    st.session_state.research_start_time = time.perf_counter()  # Stage 1.5: Track start time
     
     # Set the selected model in config for this session
     Config.SELECTED_MODEL = selected_model
@@ -868,14 +873,14 @@ def _run_research(topic: str, constraints: Constraints, selected_model: str):
         # Stage 1.5: Run research with progress monitoring
         class ProgressCallback:
             def __init__(self, progress_bar, status_text, eta_text):
-                self.last_update = time.time()
+                self.last_update = time.perf_counter()
                 self.progress_bar = progress_bar
                 self.status_text = status_text
                 self.eta_text = eta_text
                 
             def update_progress(self, state):
                 # Throttle updates to avoid too many reruns
-                now = time.time()
+                now = time.perf_counter()
                 if now - self.last_update > 0.5:  # Update every 0.5 seconds max
                     st.session_state.research_state = state
                     
@@ -1274,12 +1279,10 @@ def _render_enhanced_sources_tab(results):
         st.caption("Sources that were referenced in the final report")
         
         # Group cited sources by domain
-        domain_groups = {}
+        domain_groups = defaultdict(list)
         for doc in cited_docs:
             url = doc.get("url", "")
             domain = url.split("//")[-1].split("/")[0] if "//" in url else "unknown"
-            if domain not in domain_groups:
-                domain_groups[domain] = []
             domain_groups[domain].append(doc)
         
         for domain, docs in domain_groups.items():
@@ -1333,6 +1336,48 @@ def _render_enhanced_sources_tab(results):
                     st.markdown("---")
 
 
+def _claim_statistics(claims: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Claim counts by type and confidence statistics, gathered in one pass over the claims."""
+    claim_types: Counter[str] = Counter()
+    confidence_sum = 0.0
+    min_conf: Optional[float] = None
+    max_conf: Optional[float] = None
+    high_conf_count = 0
+    for claim in claims:
+        claim_type = claim.get('type', 'unknown')
+        claim_types[claim_type] += 1
+        confidence = claim.get('confidence', 0)
+        confidence_sum += confidence
+        if min_conf is None or confidence < min_conf:
+            min_conf = confidence
+        if max_conf is None or confidence > max_conf:
+            max_conf = confidence
+        if confidence > 0.7:
+            high_conf_count += 1
+    
+    return {
+        "claim_types": claim_types,
+        "avg_confidence": confidence_sum / len(claims) if claims else 0.0,
+        "min_confidence": min_conf,
+        "max_confidence": max_conf,
+        "high_confidence_count": high_conf_count
+    }
+
+
+def _get_claim_statistics(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Claim statistics for a research result.
+    
+    Computed once and kept on the result itself, which lives in session state,
+    so Streamlit reruns (e.g. paging through claims) reuse it.
+    """
+    claim_stats = results.get("_claim_stats")
+    if claim_stats is None:
+        claims = results.get("state", {}).get("claims", [])
+        claim_stats = results["_claim_stats"] = _claim_statistics(claims)
+    return claim_stats
+
+
 def _render_details_tab(results):
     """Render details tab with organized sections and consistent styling."""
     
@@ -1478,29 +1523,25 @@ def _render_details_tab(results):
         claims = state.get('claims', [])
         if claims:
             # Calculate statistics
-            claim_types = {}
-            confidence_scores = []
-            for claim in claims:
-                claim_type = claim.get('type', 'unknown')
-                claim_types[claim_type] = claim_types.get(claim_type, 0) + 1
-                confidence_scores.append(claim.get('confidence', 0))
+            claim_stats = _get_claim_statistics(results)
+            claim_types = claim_stats["claim_types"]
             
             # Display in organized format
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("**Distribution by Type**")
-                for claim_type, count in sorted(claim_types.items(), key=lambda x: x[1], reverse=True):
+                for claim_type, count in claim_types.most_common():
                     percentage = (count/len(claims)*100)
                     st.write(f"• **{claim_type.title()}:** {count} ({percentage:.1f}%)")
             
             with col2:
                 st.markdown("**Confidence Metrics**")
-                if confidence_scores:
-                    avg_conf = sum(confidence_scores) / len(confidence_scores)
-                    min_conf = min(confidence_scores)
-                    max_conf = max(confidence_scores)
-                    high_conf_count = sum(1 for c in confidence_scores if c > 0.7)
+                if claim_stats["min_confidence"] is not None:
+                    avg_conf = claim_stats["avg_confidence"]
+                    min_conf = claim_stats["min_confidence"]
+                    max_conf = claim_stats["max_confidence"]
+                    high_conf_count = claim_stats["high_confidence_count"]
                     
                     st.metric("Average Confidence", f"{avg_conf:.2f}")
                     st.metric("High Confidence (>0.7)", high_conf_count)
@@ -1593,12 +1634,8 @@ def _render_metrics_tab(results: Dict[str, Any]):
             st.markdown("#### 📝 Claims Breakdown")
             
             # Calculate statistics
-            claim_types = {}
-            confidence_scores = []
-            for claim in claims:
-                claim_type = claim.get('type', 'unknown')
-                claim_types[claim_type] = claim_types.get(claim_type, 0) + 1
-                confidence_scores.append(claim.get('confidence', 0))
+            claim_stats = _get_claim_statistics(results)
+            claim_types = claim_stats["claim_types"]
             
             # Two-column layout for claim stats
             col1, col2 = st.columns(2)
@@ -1607,7 +1644,7 @@ def _render_metrics_tab(results: Dict[str, Any]):
                 # Claims by type using Streamlit components
                 st.markdown("**Distribution by Type**")
                 type_data = [[t.title(), c, f"{(c/len(claims)*100):.1f}%"]
-                            for t, c in sorted(claim_types.items(), key=lambda x: x[1], reverse=True)]
+                            for t, c in claim_types.most_common()]
                 
                 # Headers
                 header_cols = st.columns([2, 1, 1])
@@ -1626,11 +1663,11 @@ def _render_metrics_tab(results: Dict[str, Any]):
             with col2:
                 # Confidence statistics using Streamlit components
                 st.markdown("**Confidence Metrics**")
-                if confidence_scores:
-                    avg_conf = sum(confidence_scores) / len(confidence_scores)
-                    min_conf = min(confidence_scores)
-                    max_conf = max(confidence_scores)
-                    high_conf_count = sum(1 for c in confidence_scores if c > 0.7)
+                if claim_stats["min_confidence"] is not None:
+                    avg_conf = claim_stats["avg_confidence"]
+                    min_conf = claim_stats["min_confidence"]
+                    max_conf = claim_stats["max_confidence"]
+                    high_conf_count = claim_stats["high_confidence_count"]
                     
                     # Use metrics for better display
                     metric_col1, metric_col2 = st.columns(2)
@@ -1706,7 +1743,7 @@ def _render_export_tab(results: Dict[str, Any]):
     
     with col2:
         # Download JSON
-        report_json = json.dumps(report, indent=2, default=str)
+        report_json = export_report_to_json(report)
         filename_json = f"nova_brief_data_{timestamp}.json"
         
         st.download_button(
@@ -1,7 +1,7 @@
 """Configuration management for Nova Brief."""
 
 import os
-from typing import Optional, Dict, Any, List, NamedTuple
+from typing import ClassVar, Optional, Dict, Any, List, NamedTuple
 from dotenv import load_dotenv
 from .observability.logging import get_logger
 
@@ -98,6 +98,9 @@ class Config:
         }
     }
     
+    # Variants per base model, filled in lazily by get_models_by_base_model
+    _models_by_base_model: ClassVar[Optional[Dict[str, Dict[str, ModelConfig]]]] = None
+    
     # Generate all available model combinations dynamically
     @classmethod
     def _generate_available_models(cls) -> Dict[str, ModelConfig]:
@@ -165,9 +168,14 @@ class Config:
     MAX_ROUNDS: int = int(os.getenv("MAX_ROUNDS", "3"))
     PER_DOMAIN_CAP: int = int(os.getenv("PER_DOMAIN_CAP", "3"))
     FETCH_TIMEOUT_S: float = float(os.getenv("FETCH_TIMEOUT_S", "15.0"))
+    # Concurrent research pipelines per LLM provider in multi-model evaluations
+    PROVIDER_CONCURRENCY: int = int(os.getenv("PROVIDER_CONCURRENCY", "8"))
     
     # Feature Flags
     ENABLE_CACHE: bool = os.getenv("ENABLE_CACHE", "false").lower() == "true"
+    LLM_CACHE_DIR: str = os.getenv("LLM_CACHE_DIR", "exports/.llm_cache")
+    LLM_CACHE_TTL_S: float = float(os.getenv("LLM_CACHE_TTL_S", str(7 * 24 * 3600)))
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
     
     # System Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -196,11 +204,19 @@ class Config:
     @classmethod
     def get_models_by_base_model(cls, base_model: str) -> Dict[str, ModelConfig]:
         """Get all variants of a base model."""
-        available_models = cls.get_available_models_dict()
-        return {
-            key: config for key, config in available_models.items()
-            if key.startswith(base_model)
-        }
+        # The model registry is fixed, so each base model is filtered only once;
+        # callers get a copy so the memoized dict cannot be mutated
+        if cls._models_by_base_model is None:
+            cls._models_by_base_model = {}
+        variants = cls._models_by_base_model.get(base_model)
+        if variants is None:
+            available_models = cls.get_available_models_dict()
+            variants = {
+                key: config for key, config in available_models.items()
+                if key.startswith(base_model)
+            }
+            cls._models_by_base_model[base_model] = variants
+        return dict(variants)
     
     @classmethod
     def get_cerebras_supported_models(cls) -> Dict[str, ModelConfig]:
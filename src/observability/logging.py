@@ -1,10 +1,19 @@
 """Logging configuration and utilities for Nova Brief."""
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 
+# All loggers hand records to one queue; a single background listener thread
+# formats them and writes to stdout, so logging call sites (e.g. the trace
+# events emitted by concurrent pipelines) never block on console I/O
+_log_queue: Optional[queue.SimpleQueue] = None
+_log_listener: Optional[QueueListener] = None
+
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -24,23 +33,34 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
+def _get_log_queue() -> queue.SimpleQueue:
+    """Get the shared log queue, starting its console listener on first use."""
+    global _log_queue, _log_listener
+    if _log_queue is None:
+        # Console handler
+        handler = logging.StreamHandler(sys.stdout)
+        
+        # Structured format
+        formatter = logging.Formatter(
+            "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+        handler.setFormatter(formatter)
+        
+        _log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(_log_queue, handler)
+        _log_listener.start()
+        # Stopping the listener writes out any records still queued
+        atexit.register(_log_listener.stop)
+    return _log_queue
+
+
 def _configure_logger(logger: logging.Logger) -> None:
     """Configure logger with appropriate handlers and formatting."""
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     logger.setLevel(getattr(logging, log_level, logging.INFO))
     
-    # Console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logger.level)
-    
-    # Structured format
-    formatter = logging.Formatter(
-        "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    handler.setFormatter(formatter)
-    
-    logger.addHandler(handler)
+    logger.addHandler(QueueHandler(_get_log_queue()))
     logger.propagate = False
 
 
@@ -1,7 +1,9 @@
 """Tracing and event emission for Nova Brief."""
 
+import sys
 import time
-from typing import Any, Dict, Optional
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -9,19 +11,40 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Every pipeline stage, LLM call and span emits events, so they are kept as
+# compact __slots__ instances where the running Python supports it (3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class TraceEvent:
     """Represents a trace event with structured data."""
     
     event_type: str
     timestamp: datetime = field(default_factory=datetime.now)
+    perf_counter: float = field(default_factory=time.perf_counter)
     duration_ms: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     parent_id: Optional[str] = None
     trace_id: Optional[str] = None
 
 
+# Per-task trace buffer. asyncio copies the current context into every task it
+# creates, so concurrent evaluations each collect their own events after calling
+# clear_trace_events(); outside such a scope events are only logged.
+_trace_events: ContextVar[Optional[List[TraceEvent]]] = ContextVar("trace_events", default=None)
+
+
+def clear_trace_events() -> None:
+    """Start a fresh trace buffer for the current task/context."""
+    _trace_events.set([])
+
+
+def get_trace_events() -> List[TraceEvent]:
+    """Get events emitted in the current context since the last clear_trace_events()."""
+    return list(_trace_events.get() or [])
+
+
 def emit_event(
     event_type: str,
     metadata: Optional[Dict[str, Any]] = None,
@@ -47,6 +70,10 @@ def emit_event(
         trace_id=trace_id
     )
     
+    events = _trace_events.get()
+    if events is not None:
+        events.append(event)
+    
     # For MVP, log events as structured logs
     # In Stage 3+, this would emit to OpenTelemetry
     logger.info(
@@ -90,10 +117,10 @@ def end_span(span_id: str, start_time: float, metadata: Optional[Dict[str, Any]]
     
     Args:
         span_id: ID of the span to end
-        start_time: Start time from time.time()
+        start_time: Start time from time.perf_counter()
         metadata: Additional metadata to include
     """
-    duration_ms = (time.time() - start_time) * 1000
+    duration_ms = (time.perf_counter() - start_time) * 1000
     
     emit_event(
         "span_end",
@@ -108,6 +135,8 @@ def end_span(span_id: str, start_time: float, metadata: Optional[Dict[str, Any]]
 class TimedOperation:
     """Context manager for timing operations with automatic span management."""
     
+    __slots__ = ("operation_name", "parent_id", "span_id", "start_time")
+    
     def __init__(self, operation_name: str, parent_id: Optional[str] = None):
         self.operation_name = operation_name
         self.parent_id = parent_id
@@ -115,12 +144,12 @@ class TimedOperation:
         self.start_time: Optional[float] = None
     
     def __enter__(self) -> "TimedOperation":
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.span_id = start_span(self.operation_name, self.parent_id)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self.span_id and self.start_time:
+        if self.span_id and self.start_time is not None:
             metadata = {}
             if exc_type:
                 metadata["error"] = str(exc_val)
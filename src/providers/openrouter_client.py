@@ -1,12 +1,16 @@
 """Multi-provider LLM client for Nova Brief."""
 
+import asyncio
+import contextlib
 import os
-from typing import Any, Dict, List, Optional, Union
-from openai import OpenAI
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, Union
+from openai import AsyncOpenAI
 
 from ..config import Config, ModelConfig
 from ..observability.logging import get_logger, redact_sensitive_data
 from ..observability.tracing import TimedOperation, emit_event
+from ..storage.llm_cache import LLMResponseCache, get_llm_cache
 
 logger = get_logger(__name__)
 
@@ -89,7 +93,7 @@ class LLMClient:
             "provider" in self.model_config.provider_params):
             headers["X-OpenRouter-Provider"] = self.model_config.provider_params["provider"]
         
-        self.client = OpenAI(
+        self.client = AsyncOpenAI(
             api_key=self.api_key,
             base_url=self.model_config.base_url,
             timeout=self.timeout,
@@ -100,13 +104,28 @@ class LLMClient:
         """Initialize Anthropic client."""
         try:
             import anthropic
-            self.client = anthropic.Anthropic(
+            self.client = anthropic.AsyncAnthropic(
                 api_key=self.api_key,
                 timeout=self.timeout
             )
         except ImportError:
             raise ImportError("anthropic package is required for Anthropic models. Install with: uv add anthropic")
     
+    async def aclose(self) -> None:
+        """Close the provider client and its HTTP connection pool."""
+        await self.client.close()
+    
+    async def __aenter__(self) -> "LLMClient":
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        await self.aclose()
+    
     @property
     def model(self) -> str:
         """Get the model ID for the current configuration."""
@@ -121,6 +140,17 @@ class LLMClient:
             raise ValueError("Model configuration is not available")
         return self.model_config.provider
     
+    @property
+    def uses_explicit_prompt_caching(self) -> bool:
+        """
+        Whether prompt prefixes must be marked for caching explicitly.
+        
+        OpenAI-style providers cache stable prompt prefixes automatically as long
+        as the system prompt comes first; Anthropic models (direct or through
+        OpenRouter) only cache content tagged with cache_control.
+        """
+        return self.provider == "anthropic" or self.model.startswith("anthropic/")
+    
     async def chat(
         self,
         messages: List[Dict[str, str]],
@@ -129,6 +159,7 @@ class LLMClient:
         response_format: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        cacheable: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -141,14 +172,48 @@ class LLMClient:
             response_format: Response format specification for structured output
             tools: Available tools for function calling
             tool_choice: Tool choice specification
+            cacheable: Serve and store this request through the LLM response
+                cache even though it samples (temperature > 0)
             **kwargs: Additional parameters
         
         Returns:
             Dictionary with success status, response data, and metrics
         """
+        # Sampled responses are not reproducible, so only deterministic requests
+        # and ones whose caller opted in are served from or stored in the cache
+        cache = get_llm_cache() if cacheable or temperature <= 0 else None
+        cache_key = None
+        if cache:
+            cache_key = LLMResponseCache.make_key(
+                self.model,
+                messages,
+                temperature,
+                tools=tools,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                tool_choice=tool_choice,
+                **kwargs
+            )
+            # Cache reads and writes are file I/O; keep them off the event loop
+            cached = await asyncio.to_thread(cache.get, self.model, cache_key)
+            if cached:
+                emit_event(
+                    "chat_completion_cache_hit",
+                    metadata={"model": self.model, "provider": self.provider}
+                )
+                return {
+                    "success": True,
+                    "response": None,
+                    "content": cached["content"],
+                    "metrics": {**cached.get("metrics", {}), "cache_hit": True}
+                }
+        
         with TimedOperation(f"{self.provider}_chat_completion") as timer:
             try:
                 # Prepare request parameters
+                if self.uses_explicit_prompt_caching:
+                    messages = _mark_cacheable_prefix(messages)
+                
                 request_params = {
                     "model": self.model,
                     "messages": messages,
@@ -181,15 +246,17 @@ class LLMClient:
                 })
                 logger.info("Sending chat completion request", extra=log_params)
                 
-                # Make the API call
-                response = self.client.chat.completions.create(**request_params)
+                # Make the API call (async client so concurrent pipelines don't block the loop)
+                response = await self.client.chat.completions.create(**request_params)
                 
                 # Extract metrics
                 usage = response.usage
+                prompt_details = getattr(usage, "prompt_tokens_details", None) if usage else None
                 metrics = {
                     "prompt_tokens": usage.prompt_tokens if usage else 0,
                     "completion_tokens": usage.completion_tokens if usage else 0,
                     "total_tokens": usage.total_tokens if usage else 0,
+                    "cached_tokens": getattr(prompt_details, "cached_tokens", 0) or 0,
                     "model": response.model,
                 }
                 
@@ -228,10 +295,13 @@ class LLMClient:
                     }
                 )
                 
+                if cache is not None and cache_key:
+                    await asyncio.to_thread(cache.set, self.model, cache_key, content, metrics)
+                
                 return {
                     "success": True,
                     "response": response,
-                    "content": response.choices[0].message.content if response.choices else None,
+                    "content": content,
                     "metrics": metrics
                 }
                 
@@ -264,12 +334,32 @@ class LLMClient:
 OpenRouterClient = LLMClient
 
 
+@contextlib.asynccontextmanager
+async def use_client(
+    client: Optional[LLMClient] = None,
+    model_key: Optional[str] = None
+) -> AsyncIterator[LLMClient]:
+    """
+    Yield the caller's client, or a new one for model_key that is closed on exit.
+    
+    Agents take an optional client so a pipeline can share one connection pool
+    across stages; when run on their own they get a client scoped to the call.
+    """
+    if client is not None:
+        yield client
+        return
+    async with LLMClient(model_key=model_key) as owned:
+        yield owned
+
+
 # Convenience function for backward compatibility
 async def chat(
     messages: List[Dict[str, str]],
     temperature: float = 0.1,
     max_tokens: Optional[int] = None,
     response_format: Optional[Dict[str, Any]] = None,
+    client: Optional[LLMClient] = None,
+    cacheable: bool = False,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -280,19 +370,51 @@ async def chat(
         temperature: Sampling temperature
         max_tokens: Maximum tokens to generate
         response_format: Response format for structured output
+        client: Existing client to reuse (and its connection pool); without
+            one, a client is created for this call and closed after it
+        cacheable: Use the LLM response cache even at temperature > 0
         **kwargs: Additional parameters
     
     Returns:
         Chat completion response dictionary
     """
-    client = LLMClient()
-    return await client.chat(
-        messages=messages,
-        temperature=temperature,
-        max_tokens=max_tokens,
-        response_format=response_format,
-        **kwargs
-    )
+    async with use_client(client) as active:
+        return await active.chat(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            cacheable=cacheable,
+            **kwargs
+        )
+
+
+def _mark_cacheable_prefix(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Tag system prompts as ephemeral cache breakpoints.
+    
+    Agent system prompts are long and identical across calls, so caching them
+    makes repeated planner/analyst/writer calls bill the prefix at the cached rate.
+    
+    Args:
+        messages: Chat messages with plain string content
+    
+    Returns:
+        Messages with system prompt content converted to cacheable text blocks
+    """
+    marked = []
+    for message in messages:
+        if message.get("role") == "system" and isinstance(message.get("content"), str):
+            message = {
+                **message,
+                "content": [{
+                    "type": "text",
+                    "text": message["content"],
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            }
+        marked.append(message)
+    return marked
 
 
 def create_json_schema_format(schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,11 +1,13 @@
 """Search providers for Nova Brief."""
 
+import asyncio
 import re
 from typing import Dict, List, Optional, Set
 from urllib.parse import urlparse
 import tldextract
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from ..storage.cache import LFUCache
 from ..observability.logging import get_logger
 from ..observability.tracing import TimedOperation, emit_event
 
@@ -86,26 +88,31 @@ class DuckDuckGoProvider:
                     extra={"query": query, "max_results": max_results}
                 )
                 
+                def _sync_search() -> List[Dict[str, str]]:
+                    with DDGS() as ddgs:
+                        return list(ddgs.text(
+                            keywords=query,
+                            region=region,
+                            max_results=max_results,
+                            backend="api"
+                        ))
+                
+                # DDGS is synchronous; run it in a worker thread so concurrent
+                # research pipelines keep making progress while we wait.
+                search_results = await asyncio.to_thread(_sync_search)
+                
                 results = []
-                with DDGS() as ddgs:
-                    search_results = ddgs.text(
-                        keywords=query,
-                        region=region,
-                        max_results=max_results,
-                        backend="api"
-                    )
-                    
-                    for result in search_results:
-                        try:
-                            search_result = SearchResult(
-                                title=result.get("title", ""),
-                                url=result.get("href", ""),
-                                snippet=result.get("body", "")
-                            )
-                            results.append(search_result)
-                        except Exception as e:
-                            logger.warning(f"Failed to parse search result: {e}")
-                            continue
+                for result in search_results:
+                    try:
+                        search_result = SearchResult(
+                            title=result.get("title", ""),
+                            url=result.get("href", ""),
+                            snippet=result.get("body", "")
+                        )
+                        results.append(search_result)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse search result: {e}")
+                        continue
                 
                 logger.info(
                     f"DuckDuckGo search completed: {len(results)} results",
@@ -154,7 +161,8 @@ class SearchManager:
         max_results_per_query: int = 10,
         include_domains: Optional[List[str]] = None,
         exclude_domains: Optional[List[str]] = None,
-        per_domain_cap: int = 3
+        per_domain_cap: int = 3,
+        cache: Optional[LFUCache] = None
     ) -> List[SearchResult]:
         """
         Execute search queries with filtering and deduplication.
@@ -166,6 +174,7 @@ class SearchManager:
             include_domains: Domains to include (allowlist)
             exclude_domains: Domains to exclude (denylist)
             per_domain_cap: Maximum results per domain across all queries
+            cache: Optional cache of raw per-query results shared across runs
         
         Returns:
             Deduplicated and filtered list of SearchResult objects
@@ -177,9 +186,20 @@ class SearchManager:
         all_results: List[SearchResult] = []
         
         for query in queries:
+            # Raw provider results are cached; filtering and capping below still
+            # apply per call, so cached and fresh queries combine identically
+            cache_key = (provider, query.strip().lower(), max_results_per_query)
+            if cache is not None:
+                cached_results = cache.get(cache_key)
+                if cached_results is not None:
+                    all_results.extend(cached_results)
+                    continue
+            
             try:
                 results = await search_provider.search(query, max_results_per_query)
                 all_results.extend(results)
+                if cache is not None:
+                    cache.set(cache_key, results)
             except Exception as e:
                 logger.error(f"Search failed for query '{query}': {e}")
                 continue
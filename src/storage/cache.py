@@ -0,0 +1,60 @@
+"""In-memory caches shared across research pipeline runs."""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class LFUCache:
+    """
+    Bounded in-memory cache with least-frequently-used eviction.
+
+    Used to share search and fetch results between pipeline runs (e.g. across
+    evaluation topics) so repeated queries and URLs are only hit once.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # key -> (value, use count)
+        self._entries: Dict[Hashable, Tuple[Any, int]] = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for a key, counting the lookup as a hit or miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, count = entry
+        self._entries[key] = (value, count + 1)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least frequently used entry when full."""
+        entry = self._entries.get(key)
+        if entry is None and len(self._entries) >= self.max_entries:
+            # Inline scan for the least used key, without a key= lambda per entry
+            victim, victim_count = None, None
+            for k, (_, count) in self._entries.items():
+                if victim_count is None or count < victim_count:
+                    victim, victim_count = k, count
+                    if count == 0:
+                        break
+            del self._entries[victim]
+        self._entries[key] = (value, entry[1] if entry else 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters for reporting."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,176 @@
+"""On-disk cache for LLM chat completions."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from ..config import Config
+from ..observability.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Exact-match response cache keyed on the full request payload.
+
+    Entries are stored as ``<cache_dir>/<model>/<key>.json`` with a creation time
+    and TTL. Each model keeps at most ``max_entries_per_model`` entries; when the
+    cap is exceeded the least frequently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl_s: float,
+        max_entries_per_model: int = 50_000
+    ):
+        self.cache_dir = cache_dir
+        self.ttl_s = ttl_s
+        self.max_entries_per_model = max_entries_per_model
+        self.hits = 0
+        self.misses = 0
+        # model dir -> {key: use count}, loaded lazily from disk
+        self._frequencies: Dict[str, Dict[str, int]] = {}
+        # model dirs known to exist, so writes skip the makedirs call
+        self._created_dirs: Set[str] = set()
+        # get/set run in worker threads (asyncio.to_thread); the file I/O runs
+        # unlocked, the counters and frequency bookkeeping under this lock
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **params: Any
+    ) -> str:
+        """Build a stable SHA256 key for a chat request."""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "tools": sorted(tools or [], key=lambda tool: json.dumps(tool, sort_keys=True)),
+            "temperature": temperature,
+            **{name: value for name, value in params.items() if value is not None}
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, model: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a key, or None on a miss or expiry."""
+        path = self._entry_path(model, key)
+        try:
+            with open(path, "rb") as f:
+                entry: Dict[str, Any] = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if time.time() - entry.get("created_at", 0) > entry.get("ttl", self.ttl_s):
+            with self._lock:
+                self._remove(model, key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            frequencies = self._model_frequencies(model)
+            frequencies[key] = frequencies.get(key, 0) + 1
+            self.hits += 1
+        return entry
+
+    def set(self, model: str, key: str, content: Optional[str], metrics: Dict[str, Any]) -> None:
+        """Store a successful response, evicting the least used entry if over capacity."""
+        if content is None:
+            return
+
+        entry = {
+            "created_at": time.time(),
+            "ttl": self.ttl_s,
+            "model": model,
+            "content": content,
+            "metrics": metrics
+        }
+        path = self._entry_path(model, key)
+        model_dir = os.path.dirname(path)
+        try:
+            if model_dir not in self._created_dirs:
+                os.makedirs(model_dir, exist_ok=True)
+                self._created_dirs.add(model_dir)
+            # Per-thread temp name: concurrent identical requests write the same key
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode("utf-8"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # The directory may have been removed under us; recreate it next time
+            self._created_dirs.discard(model_dir)
+            logger.warning(f"Could not write LLM cache entry: {e}")
+            return
+
+        with self._lock:
+            frequencies = self._model_frequencies(model)
+            frequencies.setdefault(key, 0)
+            while len(frequencies) > self.max_entries_per_model:
+                victim = min(frequencies, key=frequencies.__getitem__)
+                self._remove(model, victim)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for reporting."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def _model_dir(self, model: str) -> str:
+        return os.path.join(self.cache_dir, model.replace("/", "__").replace(":", "_"))
+
+    def _entry_path(self, model: str, key: str) -> str:
+        return os.path.join(self._model_dir(model), f"{key}.json")
+
+    def _model_frequencies(self, model: str) -> Dict[str, int]:
+        model_dir = self._model_dir(model)
+        frequencies = self._frequencies.get(model_dir)
+        if frequencies is None:
+            try:
+                names = os.listdir(model_dir)
+            except OSError:
+                names = []
+            frequencies = {name[:-5]: 0 for name in names if name.endswith(".json")}
+            self._frequencies[model_dir] = frequencies
+        return frequencies
+
+    def _remove(self, model: str, key: str) -> None:
+        self._model_frequencies(model).pop(key, None)
+        try:
+            os.remove(self._entry_path(model, key))
+        except OSError:
+            pass
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get the process-wide LLM response cache, or None when caching is disabled."""
+    global _llm_cache
+    if not Config.ENABLE_CACHE:
+        return None
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache(
+            cache_dir=Config.LLM_CACHE_DIR,
+            ttl_s=Config.LLM_CACHE_TTL_S,
+            max_entries_per_model=Config.LLM_CACHE_MAX_ENTRIES
+        )
+    return _llm_cache
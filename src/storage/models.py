@@ -170,22 +170,26 @@ def create_initial_state(topic: str, constraints: Optional[Constraints] = None)
 
 
 # Data validation helpers
+_SEARCH_RESULT_FIELDS = ("title", "url", "snippet")
+_CLAIM_FIELDS = frozenset({"id", "text", "type", "confidence"})
+_CLAIM_TYPES = frozenset({"fact", "estimate", "opinion"})
+_DOCUMENT_FIELDS = frozenset({"url", "title", "text", "content_type", "source_meta"})
+
+
 def validate_search_result(result: Dict[str, Any]) -> bool:
     """Validate a search result dictionary."""
-    required_fields = {"title", "url", "snippet"}
-    return all(field in result and isinstance(result[field], str) for field in required_fields)
+    return all(isinstance(result.get(field), str) for field in _SEARCH_RESULT_FIELDS)
 
 
 def validate_claim(claim: Dict[str, Any]) -> bool:
     """Validate a claim dictionary."""
-    required_fields = {"id", "text", "type", "confidence"}
-    if not all(field in claim for field in required_fields):
+    if not _CLAIM_FIELDS.issubset(claim):
         return False
     
     if not isinstance(claim["confidence"], (int, float)) or not 0.0 <= claim["confidence"] <= 1.0:
         return False
     
-    if claim["type"] not in {"fact", "estimate", "opinion"}:
+    if claim["type"] not in _CLAIM_TYPES:
         return False
     
     return True
@@ -193,8 +197,7 @@ def validate_claim(claim: Dict[str, Any]) -> bool:
 
 def validate_document(document: Dict[str, Any]) -> bool:
     """Validate a document dictionary."""
-    required_fields = {"url", "title", "text", "content_type", "source_meta"}
-    return all(field in document for field in required_fields)
+    return _DOCUMENT_FIELDS.issubset(document)
 
 
 # Content chunking utilities
@@ -1,7 +1,33 @@
 """Content quality validation utilities for Stage 1.5."""
 
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Boilerplate/error phrases that mark a page as not real content (matched case-insensitively)
+_BOILERPLATE_PHRASES = (
+    "enable javascript",
+    "access denied",
+    "forbidden",
+    "captcha",
+    "page not found",
+    "javascript is disabled",
+    "cookies must be enabled",
+    "please enable cookies",
+    "this page requires javascript",
+    "error 403",
+    "error 404",
+    "error 500",
+    "service unavailable",
+    "temporarily unavailable",
+    "site maintenance"
+)
+
+# Finds every phrase in one scan of the text; the lookahead makes matches
+# zero-width so overlapping phrases (e.g. "enable javascript" and
+# "javascript is disabled") are all reported
+_BOILERPLATE_RE = re.compile(
+    "(?=(" + "|".join(re.escape(phrase) for phrase in _BOILERPLATE_PHRASES) + "))"
+)
 
 
 def validate_content(text: str) -> Dict[str, Any]:
@@ -36,8 +62,9 @@ def validate_content(text: str) -> Dict[str, Any]:
             }
         }
     
-    # Clean and tokenize text
-    words = text.lower().split()
+    # Clean and tokenize text; the lowered text is reused for the phrase scan
+    text_lower = text.lower()
+    words = text_lower.split()
     word_count = len(words)
     unique_words = set(words)
     unique_word_ratio = len(unique_words) / word_count if word_count > 0 else 0.0
@@ -68,31 +95,9 @@ def validate_content(text: str) -> Dict[str, Any]:
             }
         }
     
-    # Check for boilerplate/error phrases (case-insensitive)
-    boilerplate_phrases = [
-        "enable javascript",
-        "access denied",
-        "forbidden",
-        "captcha",
-        "page not found",
-        "javascript is disabled",
-        "cookies must be enabled",
-        "please enable cookies",
-        "this page requires javascript",
-        "error 403",
-        "error 404",
-        "error 500",
-        "service unavailable",
-        "temporarily unavailable",
-        "site maintenance"
-    ]
-    
-    text_lower = text.lower()
-    detected_phrases = []
-    
-    for phrase in boilerplate_phrases:
-        if phrase in text_lower:
-            detected_phrases.append(phrase)
+    # Check for boilerplate/error phrases (case-insensitive), reported in list order
+    found = set(_BOILERPLATE_RE.findall(text_lower))
+    detected_phrases = [phrase for phrase in _BOILERPLATE_PHRASES if phrase in found]
     
     has_boilerplate = len(detected_phrases) > 0
     
@@ -135,17 +140,19 @@ def is_likely_error_page(text: str) -> bool:
     return not validation["ok"]
 
 
-def get_content_summary(text: str) -> str:
+def get_content_summary(text: str, validation: Optional[Dict[str, Any]] = None) -> str:
     """
     Get a brief summary of content characteristics.
     
     Args:
         text: Content to summarize
+        validation: Result of validate_content(text), if already computed
         
     Returns:
         Human-readable summary string
     """
-    validation = validate_content(text)
+    if validation is None:
+        validation = validate_content(text)
     metrics = validation["metrics"]
     
     summary_parts = [
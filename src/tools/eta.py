@@ -6,6 +6,11 @@ import os
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 def get_latest_eval_results(eval_dir: str = "eval") -> Optional[Dict[str, Any]]:
     """
@@ -28,8 +33,8 @@ def get_latest_eval_results(eval_dir: str = "eval") -> Optional[Dict[str, Any]]:
         # Get the most recent file by modification time
         latest_file = max(result_files, key=os.path.getmtime)
         
-        with open(latest_file, 'r') as f:
-            return json.load(f)
+        with open(latest_file, 'rb') as f:
+            return orjson.loads(f.read()) if orjson is not None else json.load(f)
             
     except Exception:
         return None
@@ -52,8 +57,13 @@ def calculate_average_duration(eval_results: Optional[Dict[str, Any]] = None) ->
         return None
     
     try:
-        # Handle both single result and multi-result formats
-        if "duration_s" in eval_results:
+        # Handle summary, single result and multi-result formats
+        if "avg_duration_s" in eval_results:
+            # Evaluation summary format (per-topic results live in a separate NDJSON file)
+            if not eval_results.get("successful_topics"):
+                return None
+            return float(eval_results["avg_duration_s"])
+        elif "duration_s" in eval_results:
             # Single result format
             return float(eval_results["duration_s"])
         elif "results" in eval_results and isinstance(eval_results["results"], list):
@@ -87,7 +97,7 @@ def estimate_eta(progress_percent: float, start_time: Optional[float] = None) ->
     
     Args:
         progress_percent: Current progress as a float between 0.0 and 1.0
-        start_time: Start time of current operation (time.time())
+        start_time: Start time of current operation (time.perf_counter())
         
     Returns:
         Estimated seconds remaining or None if cannot calculate
@@ -109,7 +119,7 @@ def estimate_eta(progress_percent: float, start_time: Optional[float] = None) ->
     # If we have a start time, we can also use elapsed time for better accuracy
     if start_time:
         import time
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         if progress_percent > 0.1:  # Only use after some meaningful progress
             estimated_total = elapsed / progress_percent
             eta_from_elapsed = estimated_total - elapsed
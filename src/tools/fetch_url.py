@@ -1,6 +1,7 @@
 """URL fetching and HTML content extraction for Nova Brief."""
 
 import os
+import re
 import asyncio
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse, urljoin
@@ -15,6 +16,8 @@ from ..observability.tracing import TimedOperation, emit_event
 
 logger = get_logger(__name__)
 
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+
 
 class RobotsTxtChecker:
     """Utility for checking robots.txt compliance with timeout protection."""
@@ -94,7 +97,8 @@ async def run(
     timeout: float = 15.0,
     user_agent: Optional[str] = None,
     respect_robots: bool = True,
-    extract_content: bool = True
+    extract_content: bool = True,
+    client: Optional[httpx.AsyncClient] = None
 ) -> Dict[str, Any]:
     """
     Fetch URL and extract main content.
@@ -105,6 +109,7 @@ async def run(
         user_agent: User agent string (defaults to env USER_AGENT)
         respect_robots: Whether to respect robots.txt
         extract_content: Whether to extract main content from HTML
+        client: Optional shared HTTP client (connection pooling across fetches)
     
     Returns:
         Dictionary with success status, extracted content, and metadata
@@ -144,42 +149,46 @@ async def run(
                 "Upgrade-Insecure-Requests": "1",
             }
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                response.raise_for_status()
-                
-                content_type = response.headers.get("content-type", "").lower()
-                
-                # Handle different content types
-                if "text/html" in content_type or "application/xhtml" in content_type:
-                    return await _process_html(url, response.text, extract_content)
-                elif "application/pdf" in content_type:
-                    return {
-                        "success": True,
-                        "url": url,
-                        "content_type": "application/pdf",
-                        "raw_content": response.content,
-                        "text": "",  # PDF parsing handled separately
-                        "title": "",
-                        "metadata": {
-                            "size_bytes": len(response.content),
-                            "content_type": content_type
-                        }
+            # Reuse the caller's pooled client when provided
+            if client is not None:
+                response = await client.get(url, headers=headers, follow_redirects=True, timeout=timeout)
+            else:
+                async with httpx.AsyncClient(timeout=timeout) as own_client:
+                    response = await own_client.get(url, headers=headers, follow_redirects=True)
+            response.raise_for_status()
+            
+            content_type = response.headers.get("content-type", "").lower()
+            
+            # Handle different content types
+            if "text/html" in content_type or "application/xhtml" in content_type:
+                return await _process_html(url, response.text, extract_content)
+            elif "application/pdf" in content_type:
+                return {
+                    "success": True,
+                    "url": url,
+                    "content_type": "application/pdf",
+                    "raw_content": response.content,
+                    "text": "",  # PDF parsing handled separately
+                    "title": "",
+                    "metadata": {
+                        "size_bytes": len(response.content),
+                        "content_type": content_type
                     }
-                else:
-                    # Plain text or other content
-                    text_content = response.text if hasattr(response, 'text') else str(response.content)
-                    return {
-                        "success": True,
-                        "url": url,
-                        "content_type": content_type,
-                        "text": text_content[:50000],  # Limit plain text size
-                        "title": "",
-                        "metadata": {
-                            "size_bytes": len(response.content),
-                            "content_type": content_type
-                        }
+                }
+            else:
+                # Plain text or other content
+                text_content = response.text if hasattr(response, 'text') else str(response.content)
+                return {
+                    "success": True,
+                    "url": url,
+                    "content_type": content_type,
+                    "text": text_content[:50000],  # Limit plain text size
+                    "title": "",
+                    "metadata": {
+                        "size_bytes": len(response.content),
+                        "content_type": content_type
                     }
+                }
         
         except httpx.TimeoutException:
             logger.warning(f"Timeout fetching URL: {url}")
@@ -226,16 +235,11 @@ async def _process_html(url: str, html_content: str, extract_content: bool) -> D
                 url=url
             )
             
-            # Extract title
+            # Extract title (simple title extraction from HTML)
             title = ""
-            try:
-                # Simple title extraction from HTML
-                import re
-                title_match = re.search(r'<title[^>]*>([^<]+)</title>', html_content, re.IGNORECASE)
-                if title_match:
-                    title = title_match.group(1).strip()
-            except Exception:
-                pass
+            title_match = _TITLE_RE.search(html_content)
+            if title_match:
+                title = title_match.group(1).strip()
             
             if not extracted_text:
                 logger.warning(f"No content extracted from {url}")
@@ -0,0 +1,24 @@
+"""URL helpers shared by the research agents."""
+
+import re
+
+# Scheme (optional, for "//host/path" URLs) followed by the network location,
+# which runs until the first "/", "?" or "#" - the same split urlparse makes
+_NETLOC_RE = re.compile(r"(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
+
+
+def extract_domain(url: str) -> str:
+    """
+    Get the network location (domain) of a URL.
+
+    Equivalent to ``urlparse(url).netloc`` for well-formed URLs, but a single
+    precompiled match that never raises: malformed or relative URLs give "".
+
+    Args:
+        url: URL to extract the domain from
+
+    Returns:
+        Domain of the URL, or an empty string if it has none
+    """
+    match = _NETLOC_RE.match(url)
+    return match.group(1) if match else ""
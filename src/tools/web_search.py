@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Optional, Any
 from ..providers.search_providers import SearchManager
+from ..storage.cache import LFUCache
 from ..observability.logging import get_logger
 
 logger = get_logger(__name__)
@@ -13,7 +14,8 @@ async def run(
     max_results_per_query: int = 10,
     include_domains: Optional[List[str]] = None,
     exclude_domains: Optional[List[str]] = None,
-    per_domain_cap: int = 3
+    per_domain_cap: int = 3,
+    cache: Optional[LFUCache] = None
 ) -> Dict[str, Any]:
     """
     Execute web search queries and return results.
@@ -25,6 +27,7 @@ async def run(
         include_domains: Domains to include (allowlist)
         exclude_domains: Domains to exclude (denylist)
         per_domain_cap: Maximum results per domain
+        cache: Optional per-query result cache shared across runs
     
     Returns:
         Dictionary with success status, search results, and metadata
@@ -55,7 +58,8 @@ async def run(
             max_results_per_query=max_results_per_query,
             include_domains=include_domains,
             exclude_domains=exclude_domains,
-            per_domain_cap=per_domain_cap
+            per_domain_cap=per_domain_cap,
+            cache=cache
         )
         
         # Convert to dictionaries for serialization
@@ -7,6 +7,8 @@ from typing import Dict, Any
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# The eval harnesses import their shared helpers as a top-level module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'eval'))
 
 def test_imports():
     """Test that all core modules can be imported."""
@@ -224,6 +226,169 @@ def test_logging_and_tracing():
         return False
 
 
+def test_trace_buffers_isolated():
+    """Test that concurrent tasks each collect only their own trace events."""
+    print("\n🧪 Testing per-task trace buffers...")
+    
+    from src.observability.tracing import clear_trace_events, emit_event, get_trace_events
+    
+    async def _collect(name):
+        clear_trace_events()
+        emit_event(name)
+        await asyncio.sleep(0)
+        return [event.event_type for event in get_trace_events()]
+    
+    async def _collect_concurrently():
+        return await asyncio.gather(_collect("task_a"), _collect("task_b"))
+    
+    assert asyncio.run(_collect_concurrently()) == [["task_a"], ["task_b"]]
+    print("✅ Trace buffers isolated per task")
+    
+    return True
+
+
+def test_llm_response_cache():
+    """Test LLM response cache round-trip and LFU eviction."""
+    print("\n🧪 Testing LLM response cache...")
+    
+    import tempfile
+    from src.storage.llm_cache import LLMResponseCache
+    
+    messages = [{"role": "user", "content": "hello"}]
+    key = LLMResponseCache.make_key("test/model", messages, 0.0, max_tokens=100)
+    assert key == LLMResponseCache.make_key("test/model", messages, 0.0, max_tokens=100)
+    assert key != LLMResponseCache.make_key("test/model", messages, 0.5, max_tokens=100)
+    print("✅ Cache keys are stable and request-sensitive")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = LLMResponseCache(cache_dir, ttl_s=60, max_entries_per_model=2)
+        assert cache.get("test/model", key) is None
+        
+        cache.set("test/model", key, "cached answer", {"total_tokens": 10})
+        entry = cache.get("test/model", key)
+        assert entry["content"] == "cached answer"
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+        print("✅ Cache round-trip working")
+        
+        cache.set("test/model", "b" * 64, "second", {})
+        cache.set("test/model", "c" * 64, "third", {})
+        assert cache.get("test/model", key) is not None
+        assert cache.get("test/model", "b" * 64) is None
+        print("✅ Least frequently used entry evicted")
+    
+    return True
+
+
+def test_llm_chat_cache_hit():
+    """Test cacheable chat() requests are answered from the LLM response cache."""
+    print("\n🧪 Testing chat() response caching...")
+    
+    import tempfile
+    from types import SimpleNamespace
+    from src.config import Config, ModelConfig
+    from src.providers import openrouter_client
+    from src.storage import llm_cache
+    
+    calls = []
+    
+    async def fake_create(**params):
+        calls.append(params)
+        return SimpleNamespace(
+            id="resp-1",
+            model=params["model"],
+            usage=None,
+            choices=[SimpleNamespace(message=SimpleNamespace(content="plan"), finish_reason="stop")]
+        )
+    
+    model_config = ModelConfig(
+        provider="openrouter",
+        model_id="test/model",
+        display_name="Test Model",
+        api_key_env="OPENROUTER_API_KEY",
+        base_url="https://openrouter.ai/api/v1"
+    )
+    saved_key = os.environ.get("OPENROUTER_API_KEY")
+    saved_enabled, saved_cache = Config.ENABLE_CACHE, llm_cache._llm_cache
+    os.environ["OPENROUTER_API_KEY"] = saved_key or "test-key"
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            Config.ENABLE_CACHE = True
+            llm_cache._llm_cache = llm_cache.LLMResponseCache(cache_dir, ttl_s=60)
+            client = openrouter_client.LLMClient(model_config=model_config)
+            client.client = SimpleNamespace(
+                chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+            )
+            messages = [{"role": "user", "content": "plan this"}]
+            
+            async def _ask(**kwargs):
+                return await openrouter_client.chat(messages, client=client, **kwargs)
+            
+            first = asyncio.run(_ask(temperature=0.3, cacheable=True))
+            second = asyncio.run(_ask(temperature=0.3, cacheable=True))
+            assert first["content"] == second["content"] == "plan"
+            assert second["metrics"]["cache_hit"] is True
+            assert len(calls) == 1
+            print("✅ Repeated cacheable request served from cache")
+            
+            asyncio.run(_ask(temperature=0.3))
+            asyncio.run(_ask(temperature=0.3))
+            assert len(calls) == 3
+            print("✅ Sampled requests without opt-in bypass the cache")
+    finally:
+        Config.ENABLE_CACHE, llm_cache._llm_cache = saved_enabled, saved_cache
+        if saved_key is None:
+            os.environ.pop("OPENROUTER_API_KEY", None)
+    
+    return True
+
+
+def test_eta_from_eval_summary():
+    """Test ETA average duration is read from current and legacy eval results."""
+    print("\n🧪 Testing ETA average duration...")
+    
+    from src.tools.eta import calculate_average_duration
+    
+    summary = {"success": True, "successful_topics": 2, "avg_duration_s": 42.5}
+    assert calculate_average_duration(summary) == 42.5
+    print("✅ Evaluation summary average duration used")
+    
+    assert calculate_average_duration({"successful_topics": 0, "avg_duration_s": 0}) is None
+    print("✅ Summary with no successful topics gives no estimate")
+    
+    legacy = {"results": [{"duration_s": 10.0}, {"duration_s": 20.0}]}
+    assert calculate_average_duration(legacy) == 15.0
+    print("✅ Legacy per-result format still supported")
+    
+    return True
+
+
+def test_content_coverage_scores():
+    """Test both eval harnesses score expected-element coverage the same way."""
+    print("\n🧪 Testing content coverage scoring...")
+    
+    from eval_utils import evaluate_content_coverage
+    import harness
+    import multi_model_harness
+    
+    report = "Policymakers discussed framework costs; renewable adoption is rising."
+    elements = ["Policy frameworks", "Renewable energy adoption rates", "Cost of solar"]
+    
+    # Keywords match as substrings ("policy" in "policymakers"); an element is
+    # covered when matches reach half of its words, short words included
+    assert evaluate_content_coverage(report, elements) == 2 / 3
+    assert evaluate_content_coverage("", elements) == 0.0
+    assert evaluate_content_coverage("n/a", elements) == 0.0
+    assert evaluate_content_coverage("cost", ["Cost", "Costs"]) == 0.5
+    assert evaluate_content_coverage("", ["", "Policy"]) == 0.5
+    assert evaluate_content_coverage(report, []) == 1.0
+    print("✅ Coverage scores pinned")
+    
+    assert harness.evaluate_content_coverage is multi_model_harness.evaluate_content_coverage
+    print("✅ Both harnesses share one coverage implementation")
+    
+    return True
+
+
 def test_pipeline_validation():
     """Test pipeline input validation."""
     print("\n🧪 Testing pipeline validation...")
@@ -364,6 +529,11 @@ def main():
         ("Configuration", test_configuration),
         ("Data Models", test_data_models),
         ("Logging & Tracing", test_logging_and_tracing),
+        ("Trace Buffer Isolation", test_trace_buffers_isolated),
+        ("LLM Response Cache", test_llm_response_cache),
+        ("LLM Chat Cache Hit", test_llm_chat_cache_hit),
+        ("ETA From Eval Summary", test_eta_from_eval_summary),
+        ("Content Coverage", test_content_coverage_scores),
         ("Pipeline Validation", test_pipeline_validation),
         ("Pipeline Components", lambda: asyncio.run(test_basic_pipeline_components()))
     ]